@@ -8,17 +8,24 @@ Usage examples:
 - Create a group: ./groupmaker.py create group-name trainer@example.com
 - Create a group in a specific domain: ./groupmaker.py --domain example.org create group-name trainer@example.com
 - Create a group (specifying domain in group name): ./groupmaker.py create group-name@example.org trainer@example.com
+- Create a group unless it already exists: ./groupmaker.py create group-name trainer@example.com --if-not-exists
 - List groups: ./groupmaker.py list
+- List groups as NDJSON for scripts: ./groupmaker.py -q list --json
 - List members of a group: ./groupmaker.py members group-name
 - List members of a group (with domain): ./groupmaker.py members group-name@example.org
+- Stream a large member list: ./groupmaker.py members group-name --stream
 - Add a member to a group: ./groupmaker.py add group-name new.member@example.com
 - Add a member as manager: ./groupmaker.py add group-name new.member@example.com --role MANAGER
+- Add members from a file: ./groupmaker.py add-bulk group-name members.txt
 - Remove a member from a group: ./groupmaker.py remove group-name member@example.com
 - Remove a member (specifying domain): ./groupmaker.py remove group-name@example.org member@example.com
+- Remove members listed in a file: ./groupmaker.py remove-bulk group-name members.txt
 - Rename a group: ./groupmaker.py rename old-name new-name
 - Rename a group (specifying domain): ./groupmaker.py rename old-name@example.org new-name
 - Delete a group: ./groupmaker.py delete group-name
 - Delete a group (specifying domain): ./groupmaker.py delete group-name@example.org
+- Run several commands in one session: ./groupmaker.py repl
+- Hide progress messages (they go to stderr): ./groupmaker.py -q list
 
 IMPORTANT: You need a service-account-credentials.json file to use this script.
            Check the company Notion documentation for instructions on obtaining this file.
@@ -26,8 +33,12 @@ IMPORTANT: You need a service-account-credentials.json file to use this script.
 """
 
 import argparse
+import json
+import logging
+import shlex
 import sys
-import time
+from collections import Counter
+from itertools import chain
 
 # Try to load .env file if available
 try:
@@ -38,33 +49,109 @@ except ImportError:
 
 import groupmaker_core as core
 
+# Status and error messages go to stderr; stdout carries only command output
+logger = logging.getLogger('groupmaker')
+
+# Table separators for the list outputs
+GROUPS_SEPARATOR = "-" * 120
+MEMBERS_SEPARATOR = "-" * 140
+
+# Turns an email local part like 'jane.doe-smith' into 'jane doe smith'
+NAME_SEPARATORS = str.maketrans('.-', '  ')
+
+# Table rows, built once rather than as an f-string per row
+GROUP_ROW = "{:<40} {:<30} {}".format
+MEMBER_ROW = "{:<45} {:<25} {}{:<13} {:<10} {}".format
+ROLE_MARKERS = {'OWNER': '  ', 'MANAGER': '* '}  # Crown emoji removed per style guide
+
+# Rows per sys.stdout.write() call for long tables
+WRITE_CHUNK_SIZE = core.MAX_PAGE_SIZE
+
+
+def group_name_arg(value: str) -> str:
+    """argparse type that rejects invalid group names before any API setup."""
+    validation = core.validate_group_name(value)
+    if not validation.valid:
+        raise argparse.ArgumentTypeError(validation.error)
+    return value
+
+
+class LazyService:
+    """Stand-in for the Directory API service that builds it on first use."""
+
+    def __init__(self, credentials: dict):
+        self._credentials = credentials
+        self._service = None
+
+    def __getattr__(self, name):
+        if self._service is None:
+            self._service = core.create_service(self._credentials)
+            if not self._service:
+                logger.error("ERROR: Failed to create Google Directory API service.")
+                sys.exit(1)
+        return getattr(self._service, name)
+
 
 def print_error(result: core.OperationResult) -> None:
-    """Print an operation error."""
-    print(f"ERROR: {result.message}")
+    """Log an operation error."""
+    logger.error(f"ERROR: {result.message}")
     if result.error:
-        print(f"Details: {result.error}")
+        logger.error(f"Details: {result.error}")
 
 
-def print_groups_table(groups: list) -> None:
-    """Print groups in a formatted table."""
-    if not groups:
-        print("No groups found matching your criteria.")
-        return
+def format_group_row(group: dict) -> str:
+    """Format one group as a table row."""
+    description = group.get('description', '')
+    if len(description) > 30:
+        description = description[:27] + "..."
+    return GROUP_ROW(group.get('email', 'N/A'), group.get('name', 'N/A'), description)
+
+
+def format_member_row(member: dict) -> str:
+    """Format one member as a table row."""
+    email = member.get('email', 'N/A')
+    role = member.get('role', 'N/A')
 
-    separator = "-" * 120
-    print(f"\nFound {len(groups)} groups:")
-    print(separator)
+    # Extract name from email if not provided
+    name = member.get('name', '')
+    if not name and '@' in email:
+        name = email.partition('@')[0].translate(NAME_SEPARATORS).title()
+
+    # Mark derived members
+    if member.get('isDerivedMembership', False):
+        email = f"{email} (nested)"
+
+    return MEMBER_ROW(
+        email, name, ROLE_MARKERS.get(role, ''), role,
+        member.get('type', 'N/A'), member.get('status', 'N/A')
+    )
+
+
+def write_lines(lines, chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Write lines to stdout a chunk at a time instead of one print() per line."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            sys.stdout.write("\n".join(chunk) + "\n")
+            sys.stdout.flush()
+            chunk.clear()
+    if chunk:
+        sys.stdout.write("\n".join(chunk) + "\n")
+
+
+def print_groups_header() -> None:
+    """Print the groups table header."""
+    print(GROUPS_SEPARATOR)
     print(f"{'EMAIL ADDRESS':<40} {'NAME':<30} {'DESCRIPTION'}")
-    print(separator)
+    print(GROUPS_SEPARATOR)
+
 
-    for group in groups:
-        email = group.get('email', 'N/A')
-        name = group.get('name', 'N/A')
-        description = group.get('description', '')
-        if description and len(description) > 30:
-            description = description[:27] + "..."
-        print(f"{email:<40} {name:<30} {description}")
+def print_members_header() -> None:
+    """Print the members table header."""
+    print(MEMBERS_SEPARATOR)
+    print(f"{'EMAIL ADDRESS':<45} {'NAME':<25} {'ROLE':<15} {'TYPE':<10} {'STATUS'}")
+    print(MEMBERS_SEPARATOR)
 
 
 def print_members_table(members: list, group_email: str, summary: dict) -> None:
@@ -73,151 +160,165 @@ def print_members_table(members: list, group_email: str, summary: dict) -> None:
         print("No members found in this group.")
         return
 
-    separator = "-" * 140
     print(f"\nFound {len(members)} members in {group_email}:")
-    print(separator)
-    print(f"{'EMAIL ADDRESS':<45} {'NAME':<25} {'ROLE':<15} {'TYPE':<10} {'STATUS'}")
-    print(separator)
-
-    for member in members:
-        email = member.get('email', 'N/A')
-        role = member.get('role', 'N/A')
-        member_type = member.get('type', 'N/A')
-        status = member.get('status', 'N/A')
-
-        # Extract name from email if not provided
-        name = member.get('name', '')
-        if not name and '@' in email:
-            name_part = email.split('@')[0]
-            name = name_part.replace('.', ' ').replace('-', ' ').title()
-
-        # Mark derived members
-        if member.get('isDerivedMembership', False):
-            email = f"{email} (nested)"
-
-        # Role markers
-        role_marker = ''
-        if role == 'OWNER':
-            role_marker = '  '  # Crown emoji removed per style guide
-        elif role == 'MANAGER':
-            role_marker = '* '
-
-        print(f"{email:<45} {name:<25} {role_marker}{role:<13} {member_type:<10} {status}")
-
-    print(separator)
+    print_members_header()
+
+    write_lines(map(format_member_row, members))
+
+    print(MEMBERS_SEPARATOR)
     print(f"Summary: {summary['owners']} owners, {summary['managers']} managers, {summary['members']} members")
 
 
+def print_groups_table(groups, chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Print groups in a formatted table, writing each row as it arrives."""
+    groups = iter(groups)
+    first = next(groups, None)
+    if first is None:
+        print("No groups found matching your criteria.")
+        return
+
+    print_groups_header()
+
+    count = 0
+
+    def rows():
+        nonlocal count
+        for group in chain((first,), groups):
+            count += 1
+            yield format_group_row(group)
+
+    write_lines(rows(), chunk_size)
+
+    print(GROUPS_SEPARATOR)
+    print(f"Found {count} groups.")
+
+
+def print_groups_json(groups, chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Print groups as newline-delimited JSON, one object per line."""
+    write_lines((
+        json.dumps({
+            'email': group.get('email'),
+            'name': group.get('name'),
+            'description': group.get('description', ''),
+        }, separators=(',', ':'))
+        for group in groups
+    ), chunk_size)
+
+
+def stream_members_table(members, group_email: str, chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Print members as they arrive, without sorting by role."""
+    print(f"\nMembers of {group_email}:")
+    print_members_header()
+
+    roles = Counter()
+
+    def rows():
+        for member in members:
+            roles[member.get('role', 'MEMBER')] += 1
+            yield format_member_row(member)
+
+    write_lines(rows(), chunk_size)
+
+    print(MEMBERS_SEPARATOR)
+    print(f"Summary: {roles['OWNER']} owners, {roles['MANAGER']} managers, {roles['MEMBER']} members")
+
+
 def cmd_create(args, service, domain: str) -> None:
     """Handle the create command."""
     validation = core.validate_group_name(args.group_name)
-    if not validation.valid:
-        print(f"ERROR: {validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py create class-a-2023 external.trainer@example.com")
-        print("  ./groupmaker.py create class-a-2023@example.com external.trainer@example.com")
-        return
-
     group_domain = validation.domain or domain
-    group_email = f"{validation.group_name}@{group_domain}"
+    group_email = core.build_group_email(validation.group_name, group_domain)
 
-    print(f"Creating group: {group_email}...")
-    result = core.create_group(service, validation.group_name, domain=group_domain, description=args.description)
+    logger.info(f"Creating group: {group_email}...")
+    result = core.create_group(
+        service, validation.group_name, domain=group_domain,
+        description=args.description, if_not_exists=args.if_not_exists
+    )
 
     if not result.success:
         print_error(result)
-        print("Failed to create group. Check logs for details.")
+        logger.error("Failed to create group. Check logs for details.")
         return
 
-    print(result.message)
-    print("Waiting for the group to be fully created in Google's system...")
-    time.sleep(3)
-
-    if not core.ensure_group_exists(service, group_email):
-        print("Could not verify group creation. Proceeding anyway, but member addition might fail.")
-
-    # Add trainer
-    print(f"Adding trainer: {args.trainer_email}...")
-    add_result = core.add_member(service, group_email, args.trainer_email)
-    if add_result.success:
-        print(add_result.message)
-    else:
-        print_error(add_result)
+    logger.info(result.message)
+    if not result.data.get('already_exists'):
+        logger.info("Waiting for the group to be fully created in Google's system...")
+        if not core.ensure_group_exists(service, group_email):
+            logger.warning("Could not verify group creation. Proceeding anyway, but member addition might fail.")
 
-    # Add self unless skipped
+    # Add trainer (and yourself) in a single batch request
+    new_members = [args.trainer_email]
     if not args.skip_self:
-        print(f"Adding yourself: {args.self_email}...")
-        self_result = core.add_member(service, group_email, args.self_email)
-        if self_result.success:
-            print(self_result.message)
+        new_members.append(args.self_email)
+
+    logger.info(f"Adding members: {', '.join(new_members)}...")
+    results = core.add_members(service, group_email, [(email, 'MEMBER') for email in new_members])
+    for add_result in results:
+        if add_result.success:
+            logger.info(add_result.message)
         else:
-            print_error(self_result)
+            print_error(add_result)
 
-    print(f"\nGroup setup complete. Group email: {group_email}")
+    logger.info(f"\nGroup setup complete. Group email: {group_email}")
 
 
 def cmd_delete(args, service, domain: str) -> None:
     """Handle the delete command."""
     validation = core.validate_group_name(args.group_name)
-    if not validation.valid:
-        print(f"ERROR: {validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py delete class-a-2023")
-        print("  ./groupmaker.py delete class-a-2023@example.com")
-        return
-
     group_domain = validation.domain or domain
-    group_email = f"{validation.group_name}@{group_domain}"
-
-    # Check if group exists
-    check = core.get_group(service, group_email)
-    if not check.success:
-        print(f"Error: Group {group_email} not found or cannot be accessed.")
-        if check.error:
-            print(f"Details: {check.error}")
-        return
+    group_email = core.build_group_email(validation.group_name, group_domain)
 
-    # Confirm deletion
-    print(f"\nABOUT TO DELETE GROUP: {group_email}")
-    print("This action cannot be undone and will remove all members and content.")
+    # Confirm deletion; a missing group is reported by the delete call itself
+    logger.warning(f"\nABOUT TO DELETE GROUP: {group_email}")
+    logger.warning("This action cannot be undone and will remove all members and content.")
     confirmation = input("Are you sure you want to delete this group? (type 'yes' to confirm): ")
 
     if confirmation.lower() != 'yes':
-        print("Deletion cancelled.")
+        logger.info("Deletion cancelled.")
         return
 
     result = core.delete_group(service, group_email)
     if result.success:
-        print(result.message)
+        logger.info(result.message)
     else:
         print_error(result)
 
 
 def cmd_list(args, service, domain: str) -> None:
     """Handle the list command."""
-    print(f"Fetching groups from domain: {domain}...")
-    result = core.list_groups(service, domain=domain, query=args.query, max_results=args.max_results)
-
-    if result.success:
-        print_groups_table(result.data['groups'])
-    else:
-        print_error(result)
+    logger.info(f"Fetching groups from domain: {domain}...")
+    try:
+        # Groups are shown in API order, so rows can be printed page by page
+        groups = core.iter_groups(
+            service, domain=domain, query=args.query, max_results=args.max_results,
+            local_filter=args.local_filter
+        )
+        if args.json:
+            print_groups_json(groups, chunk_size=args.max_results)
+        else:
+            print_groups_table(groups, chunk_size=args.max_results)
+    except Exception as e:
+        logger.error(f"ERROR: Failed to list groups\nDetails: {e}")
 
 
 def cmd_members(args, service, domain: str) -> None:
     """Handle the members command."""
     validation = core.validate_group_name(args.group_name)
-    if not validation.valid:
-        print(f"ERROR: {validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py members class-a-2023")
-        print("  ./groupmaker.py members class-a-2023@example.com")
-        return
-
     group_domain = validation.domain or domain
-    group_email = f"{validation.group_name}@{group_domain}"
+    group_email = core.build_group_email(validation.group_name, group_domain)
+
+    logger.info(f"Fetching members for group: {group_email}...")
+    if args.stream:
+        try:
+            stream_members_table(core.iter_members(
+                service, group_email,
+                include_derived=args.include_derived,
+                max_results=args.max_results
+            ), group_email, chunk_size=args.max_results)
+        except Exception as e:
+            logger.error(f"ERROR: Failed to list members\nDetails: {e}")
+        return
 
-    print(f"Fetching members for group: {group_email}...")
     result = core.list_members(
         service, group_email,
         include_derived=args.include_derived,
@@ -232,109 +333,253 @@ def cmd_members(args, service, domain: str) -> None:
 
 def cmd_add(args, service, domain: str) -> None:
     """Handle the add command."""
-    validation = core.validate_group_name(args.group_name)
-    if not validation.valid:
-        print(f"ERROR: {validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py add class-a-2023 new.member@example.com")
-        print("  ./groupmaker.py add class-a-2023@example.com new.member@example.com")
-        print("  ./groupmaker.py add class-a-2023 new.member@example.com --role MANAGER")
+    # Validate member email before any API call
+    if not core.validate_email(args.member_email):
+        logger.error(f"Error: Invalid email address '{args.member_email}'")
+        logger.error("\nUSAGE EXAMPLE:")
+        logger.error("  ./groupmaker.py add class-a-2023 member@example.com")
         return
 
+    validation = core.validate_group_name(args.group_name)
     group_domain = validation.domain or domain
-    group_email = f"{validation.group_name}@{group_domain}"
+    group_email = core.build_group_email(validation.group_name, group_domain)
 
-    # Verify group exists
-    if not core.ensure_group_exists(service, group_email):
-        print(f"Error: Group {group_email} not found or cannot be accessed.")
+    # Verify group exists; a single check, since only a new group needs time to propagate
+    if not core.get_group(service, group_email, fields='email').success:
+        logger.error(f"Error: Group {group_email} not found or cannot be accessed.")
         return
 
     result = core.add_member(service, group_email, args.member_email, role=args.role)
     if result.success:
-        print(result.message)
+        logger.info(result.message)
     else:
         print_error(result)
 
 
-def cmd_remove(args, service, domain: str) -> None:
-    """Handle the remove command."""
-    validation = core.validate_group_name(args.group_name)
-    if not validation.valid:
-        print(f"ERROR: {validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py remove class-a-2023 member@example.com")
-        print("  ./groupmaker.py remove class-a-2023@example.com member@example.com")
-        return
+def read_email_file(path: str) -> list[str]:
+    """Read valid email addresses from a file, reporting any problems."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            emails, invalid = core.parse_email_list(f.read())
+    except (OSError, UnicodeDecodeError) as e:
+        # A binary or non-UTF-8 file is reported like a missing one
+        logger.error(f"Error: Could not read {path}: {e}")
+        return []
 
+    for entry in invalid:
+        logger.warning(f"Skipping invalid email address '{entry}'")
+    if not emails:
+        logger.error("No valid email addresses found.")
+    return emails
+
+
+def cmd_add_bulk(args, service, domain: str) -> None:
+    """Handle the add-bulk command."""
+    validation = core.validate_group_name(args.group_name)
     group_domain = validation.domain or domain
-    group_email = f"{validation.group_name}@{group_domain}"
+    group_email = core.build_group_email(validation.group_name, group_domain)
+
+    emails = read_email_file(args.file)
+    if not emails:
+        return
 
-    # Verify group exists
-    if not core.ensure_group_exists(service, group_email):
-        print(f"Error: Group {group_email} not found or cannot be accessed.")
+    # Verify group exists; a single check, since only a new group needs time to propagate
+    if not core.get_group(service, group_email, fields='email').success:
+        logger.error(f"Error: Group {group_email} not found or cannot be accessed.")
         return
 
-    # Validate member email
+    logger.info(f"Adding {len(emails)} members to {group_email}...")
+    results = core.add_members(service, group_email, [(email, args.role) for email in emails])
+
+    added = 0
+    for result in results:
+        if result.success:
+            added += 1
+            logger.info(result.message)
+        else:
+            print_error(result)
+
+    logger.info(f"\nAdded {added} of {len(emails)} members.")
+
+
+def cmd_remove(args, service, domain: str) -> None:
+    """Handle the remove command."""
+    # Validate member email before any API call
     if not core.validate_email(args.member_email):
-        print(f"Error: Invalid email address '{args.member_email}'")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py remove class-a-2023 member@example.com")
+        logger.error(f"Error: Invalid email address '{args.member_email}'")
+        logger.error("\nUSAGE EXAMPLE:")
+        logger.error("  ./groupmaker.py remove class-a-2023 member@example.com")
+        return
+
+    validation = core.validate_group_name(args.group_name)
+    group_domain = validation.domain or domain
+    group_email = core.build_group_email(validation.group_name, group_domain)
+
+    # Verify group exists; a single check, since only a new group needs time to propagate
+    if not core.get_group(service, group_email, fields='email').success:
+        logger.error(f"Error: Group {group_email} not found or cannot be accessed.")
         return
 
     result = core.remove_member(service, group_email, args.member_email)
     if result.success:
-        print(result.message)
+        logger.info(result.message)
     else:
         print_error(result)
 
 
+def cmd_remove_bulk(args, service, domain: str) -> None:
+    """Handle the remove-bulk command."""
+    validation = core.validate_group_name(args.group_name)
+    group_domain = validation.domain or domain
+    group_email = core.build_group_email(validation.group_name, group_domain)
+
+    emails = read_email_file(args.file)
+    if not emails:
+        return
+
+    # Verify group exists; a single check, since only a new group needs time to propagate
+    if not core.get_group(service, group_email, fields='email').success:
+        logger.error(f"Error: Group {group_email} not found or cannot be accessed.")
+        return
+
+    logger.info(f"Removing {len(emails)} members from {group_email}...")
+    results = core.remove_members(service, group_email, emails)
+
+    removed = 0
+    for result in results:
+        if result.success:
+            removed += 1
+            logger.info(result.message)
+        else:
+            print_error(result)
+
+    logger.info(f"\nRemoved {removed} of {len(emails)} members.")
+
+
 def cmd_rename(args, service, domain: str) -> None:
     """Handle the rename command."""
-    # Validate old group name
+    # Names were validated by argparse; this just splits off any domain
     old_validation = core.validate_group_name(args.old_group_name)
-    if not old_validation.valid:
-        print(f"ERROR: {old_validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py rename old-group-name new-group-name")
-        print("  ./groupmaker.py rename old-group-name@example.com new-group-name")
-        return
-
-    # Validate new group name
     new_validation = core.validate_group_name(args.new_group_name)
-    if not new_validation.valid:
-        print(f"ERROR: {new_validation.error}")
-        print("\nUSAGE EXAMPLE:")
-        print("  ./groupmaker.py rename old-group-name new-group-name")
-        print("  ./groupmaker.py rename old-group-name new-group-name@example.com")
-        return
 
     # Determine domain
     group_domain = old_validation.domain or new_validation.domain or domain
-    old_email = f"{old_validation.group_name}@{group_domain}"
+    old_email = core.build_group_email(old_validation.group_name, group_domain)
 
     result = core.rename_group(service, old_email, new_validation.group_name, new_domain=group_domain)
     if result.success:
-        print(result.message)
+        logger.info(result.message)
     else:
         print_error(result)
 
 
-def main():
-    # Check required environment variable
-    if not core.DEFAULT_EMAIL:
-        print("ERROR: DEFAULT_EMAIL environment variable is required.")
-        print("Please set DEFAULT_EMAIL in your .env file or environment.")
-        print("Example: DEFAULT_EMAIL=your-email@tinkertanker.com")
-        sys.exit(1)
-
+# Subcommand name -> handler, shared by main() and the repl
+COMMANDS = {
+    'create': cmd_create,
+    'delete': cmd_delete,
+    'list': cmd_list,
+    'members': cmd_members,
+    'add': cmd_add,
+    'add-bulk': cmd_add_bulk,
+    'remove': cmd_remove,
+    'remove-bulk': cmd_remove_bulk,
+    'rename': cmd_rename,
+}
+
+
+def run_repl(
+    parser: argparse.ArgumentParser, service, domain: str,
+    quiet: bool = False, verbose: bool = False
+) -> None:
+    """
+    Read commands interactively, running them all on one Directory API service.
+
+    quiet and verbose are the session's logging flags; a line's own -q or -v
+    overrides them for that command only.
+    """
+    try:
+        import readline  # noqa: F401 - gives input() line editing and history
+    except ImportError:
+        pass
+
+    print("Enter commands as on the command line, e.g. 'members class-a-2023'. Type 'exit' to quit.")
+    while True:
+        try:
+            line = input("groupmaker> ")
+        except EOFError:
+            print()
+            return
+        except KeyboardInterrupt:
+            print()
+            continue
+
+        try:
+            tokens = shlex.split(line)
+        except ValueError as e:
+            logger.error(f"ERROR: {e}")
+            continue
+        if not tokens:
+            continue
+        if tokens[0] in ('exit', 'quit'):
+            return
+
+        try:
+            args = parser.parse_args(tokens)
+        except SystemExit:
+            # argparse has already printed the usage or help text
+            continue
+
+        if args.command == 'repl':
+            logger.error("ERROR: Already in a repl session.")
+            continue
+        handler = COMMANDS.get(args.command)
+        if not handler:
+            parser.print_usage()
+            continue
+
+        if args.quiet or args.verbose:
+            configure_logging(quiet=args.quiet, verbose=args.verbose)
+        else:
+            configure_logging(quiet=quiet, verbose=verbose)
+        try:
+            handler(args, service, args.domain or domain)
+        except KeyboardInterrupt:
+            print("\nInterrupted.")
+        except EOFError:
+            # Ctrl-D at a command's own prompt, e.g. delete's confirmation
+            print()
+        except SystemExit:
+            # LazyService exits if the API client cannot be built; it has
+            # already logged why, and the next command will try again
+            pass
+
+
+def configure_logging(quiet: bool = False, verbose: bool = False) -> None:
+    """Send status messages to stderr at the level chosen by --quiet/--verbose."""
+    level = logging.WARNING if quiet else logging.DEBUG if verbose else logging.INFO
+    # basicConfig only installs the handler once; levels are set on every call
+    # so each repl line can change them
+    logging.basicConfig(stream=sys.stderr, format='%(message)s')
+    # Verbose also shows the Google API client's request logging
+    logging.getLogger().setLevel(level if verbose else logging.WARNING)
+    logger.setLevel(level)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser, also used for each repl line."""
     parser = argparse.ArgumentParser(description='Create, rename, list or delete Google Groups')
     parser.add_argument('--domain', '-d', dest='domain',
                         help=f'Domain for the Google Group (defaults to {core.DEFAULT_DOMAIN})')
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('--quiet', '-q', action='store_true',
+                           help='Only show warnings and errors on stderr')
+    verbosity.add_argument('--verbose', '-v', action='store_true',
+                           help='Show debug output, including API requests')
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
     # Create command
     create_parser = subparsers.add_parser('create', help='Create a new Google Group')
-    create_parser.add_argument('group_name', help='Name for the Google Group')
+    create_parser.add_argument('group_name', type=group_name_arg, help='Name for the Google Group')
     create_parser.add_argument('trainer_email', help='Email address of the external trainer')
     create_parser.add_argument('--skip-self', action='store_true',
                                help='Skip adding yourself to the group')
@@ -342,43 +587,80 @@ def main():
                                help=f'Your email address (defaults to {core.DEFAULT_ADMIN_EMAIL})')
     create_parser.add_argument('--description', default='',
                                help='Optional description for the group')
+    create_parser.add_argument('--if-not-exists', action='store_true',
+                               help='Reuse the group if it already exists instead of failing')
 
     # Delete command
     delete_parser = subparsers.add_parser('delete', help='Delete an existing Google Group')
-    delete_parser.add_argument('group_name', help='Name of the Google Group to delete')
+    delete_parser.add_argument('group_name', type=group_name_arg, help='Name of the Google Group to delete')
 
     # List command
     list_parser = subparsers.add_parser('list', help='List Google Groups in the domain')
-    list_parser.add_argument('--query', help='Search query to filter groups')
-    list_parser.add_argument('--max-results', type=int, default=100,
-                             help='Maximum number of results per page (default: 100)')
+    list_parser.add_argument('--query',
+                             help="Email prefix to search for, or a Directory API query such as 'name:Class*'")
+    list_parser.add_argument('--local-filter', action='store_true',
+                             help='Match --query anywhere in email, name or description (fetches every group)')
+    list_parser.add_argument('--max-results', type=int, default=core.MAX_PAGE_SIZE,
+                             help='Results per page, up to 200 (default: 200)')
+    list_parser.add_argument('--json', action='store_true',
+                             help='Print one JSON object per group (NDJSON) instead of a table')
 
     # Members command
     members_parser = subparsers.add_parser('members', help='List members of a Google Group')
-    members_parser.add_argument('group_name', help='Name of the Google Group')
+    members_parser.add_argument('group_name', type=group_name_arg, help='Name of the Google Group')
     members_parser.add_argument('--include-derived', action='store_true',
                                 help='Include members from nested groups')
-    members_parser.add_argument('--max-results', type=int, default=100,
-                                help='Maximum number of results per page (default: 100)')
+    members_parser.add_argument('--max-results', type=int, default=core.MAX_PAGE_SIZE,
+                                help='Results per page, up to 200 (default: 200)')
+    members_parser.add_argument('--stream', action='store_true',
+                                help='Print members as each page arrives, unsorted')
 
     # Add member command
     add_parser = subparsers.add_parser('add', help='Add a member to a Google Group')
-    add_parser.add_argument('group_name', help='Name of the Google Group')
+    add_parser.add_argument('group_name', type=group_name_arg, help='Name of the Google Group')
     add_parser.add_argument('member_email', help='Email address of the member to add')
-    add_parser.add_argument('--role', choices=['OWNER', 'MANAGER', 'MEMBER'], default='MEMBER',
+    add_parser.add_argument('--role', choices=core.MEMBER_ROLES, default='MEMBER',
                             help='Role to assign (default: MEMBER)')
 
+    # Add members in bulk command
+    add_bulk_parser = subparsers.add_parser('add-bulk', help='Add members to a Google Group from a file')
+    add_bulk_parser.add_argument('group_name', type=group_name_arg, help='Name of the Google Group')
+    add_bulk_parser.add_argument('file', help='File of email addresses separated by newlines, commas or spaces')
+    add_bulk_parser.add_argument('--role', choices=core.MEMBER_ROLES, default='MEMBER',
+                                 help='Role to assign to every member (default: MEMBER)')
+
     # Remove member command
     remove_parser = subparsers.add_parser('remove', help='Remove a member from a Google Group')
-    remove_parser.add_argument('group_name', help='Name of the Google Group')
+    remove_parser.add_argument('group_name', type=group_name_arg, help='Name of the Google Group')
     remove_parser.add_argument('member_email', help='Email address of the member to remove')
 
+    # Remove members in bulk command
+    remove_bulk_parser = subparsers.add_parser('remove-bulk', help='Remove members listed in a file from a Google Group')
+    remove_bulk_parser.add_argument('group_name', type=group_name_arg, help='Name of the Google Group')
+    remove_bulk_parser.add_argument('file', help='File of email addresses separated by newlines, commas or spaces')
+
     # Rename command
     rename_parser = subparsers.add_parser('rename', help='Rename an existing Google Group')
-    rename_parser.add_argument('old_group_name', help='Current name of the Google Group')
-    rename_parser.add_argument('new_group_name', help='New name for the Google Group')
+    rename_parser.add_argument('old_group_name', type=group_name_arg, help='Current name of the Google Group')
+    rename_parser.add_argument('new_group_name', type=group_name_arg, help='New name for the Google Group')
 
+    # Interactive session command
+    subparsers.add_parser('repl', help='Run several commands in one session, reusing the API connection')
+
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
+    configure_logging(quiet=args.quiet, verbose=args.verbose)
+
+    # Check required environment variable
+    if not core.DEFAULT_EMAIL:
+        logger.error("ERROR: DEFAULT_EMAIL environment variable is required.")
+        logger.error("Please set DEFAULT_EMAIL in your .env file or environment.")
+        logger.error("Example: DEFAULT_EMAIL=your-email@tinkertanker.com")
+        sys.exit(1)
 
     if not args.command:
         parser.print_help()
@@ -388,37 +670,28 @@ def main():
     creds_result = core.load_credentials()
     if creds_result.credentials is None:
         if creds_result.source == 'invalid-env':
-            print("ERROR: Invalid JSON in GOOGLE_SERVICE_ACCOUNT_JSON environment variable.")
+            logger.error("ERROR: Invalid JSON in GOOGLE_SERVICE_ACCOUNT_JSON environment variable.")
         elif creds_result.source == 'invalid-file':
-            print("ERROR: The service-account-credentials.json file contains invalid JSON.")
-            print("Please re-download the credentials file from Google Cloud Console.")
+            logger.error("ERROR: The service-account-credentials.json file contains invalid JSON.")
+            logger.error("Please re-download the credentials file from Google Cloud Console.")
         else:
-            print("ERROR: No service account credentials found!")
-            print("Please provide credentials via:")
-            print("  1. GOOGLE_SERVICE_ACCOUNT_JSON environment variable")
-            print("  2. service-account-credentials.json file (for local development)")
-            print("Check the company Notion documentation for instructions on obtaining credentials.")
+            logger.error("ERROR: No service account credentials found!")
+            logger.error("Please provide credentials via:")
+            logger.error("  1. GOOGLE_SERVICE_ACCOUNT_JSON environment variable")
+            logger.error("  2. service-account-credentials.json file (for local development)")
+            logger.error("Check the company Notion documentation for instructions on obtaining credentials.")
         sys.exit(1)
 
-    service = core.create_service(creds_result.credentials)
-    if not service:
-        print("ERROR: Failed to create Google Directory API service.")
-        sys.exit(1)
+    # Built on first API call, so argument validation errors return immediately
+    service = LazyService(creds_result.credentials)
 
     domain = args.domain or core.DEFAULT_DOMAIN
 
-    # Dispatch to command handlers
-    commands = {
-        'create': cmd_create,
-        'delete': cmd_delete,
-        'list': cmd_list,
-        'members': cmd_members,
-        'add': cmd_add,
-        'remove': cmd_remove,
-        'rename': cmd_rename,
-    }
-
-    handler = commands.get(args.command)
+    if args.command == 'repl':
+        run_repl(parser, service, domain, quiet=args.quiet, verbose=args.verbose)
+        return
+
+    handler = COMMANDS.get(args.command)
     if handler:
         handler(args, service, domain)
 
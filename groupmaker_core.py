@@ -10,12 +10,23 @@ from __future__ import annotations
 import os
 import re
 import json
+import string
 import time
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from googleapiclient.discovery import build, Resource
-from google.oauth2 import service_account
+# The Google client libraries are slow to import, so they are only loaded
+# in create_service(); commands that fail early never pay for them
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
+
+# Use orjson for parsing credentials if available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 # Default configuration from environment
@@ -29,6 +40,41 @@ SCOPES = [
     'https://www.googleapis.com/auth/admin.directory.group.member'
 ]
 
+# Member roles, highest privilege first
+MEMBER_ROLES = ('OWNER', 'MANAGER', 'MEMBER')
+VALID_ROLES = frozenset(MEMBER_ROLES)
+_ROLE_ORDER = {role: index for index, role in enumerate(MEMBER_ROLES)}
+
+# Partial-response field lists: only request what the CLI and web app display
+GROUP_LIST_FIELDS = 'nextPageToken,groups(email,name,description)'
+MEMBER_LIST_FIELDS = 'nextPageToken,members(email,role,type,status,isDerivedMembership)'
+
+# Largest page the Directory API returns for groups.list and members.list
+MAX_PAGE_SIZE = 200
+
+# Backoff (seconds) between retries while a new group propagates
+PROPAGATION_DELAYS = (0.5, 1, 2, 4)
+
+# Maximum number of calls Google accepts in one batch request
+BATCH_LIMIT = 1000
+
+# Retries (with exponential backoff) for 429, 5xx and connection errors on GETs
+NUM_RETRIES = 3
+
+# Separators accepted between pasted email addresses
+_SPLIT_RE = re.compile(r'[\s,;]+')
+
+# Letters, numbers, periods, hyphens and underscores
+_GROUP_NAME_CHARS = frozenset(string.ascii_letters + string.digits + ".-_")
+
+# Characters allowed in each part of an email address
+_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_TLD_CHARS = frozenset(string.ascii_letters)
+
+# Same rules as validate_email, applied per line of a newline-joined buffer
+_EMAIL_LINE_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.M | re.ASCII)
+
 
 @dataclass
 class OperationResult:
@@ -56,6 +102,10 @@ class CredentialsResult:
     error: Optional[str] = None
 
 
+# Last loaded credentials, keyed on their source (env value or file mtime)
+_CREDS_CACHE: dict = {'key': None, 'result': None}
+
+
 def load_credentials(
     env_var: str = "GOOGLE_SERVICE_ACCOUNT_JSON",
     file_path: str = "service-account-credentials.json"
@@ -63,6 +113,9 @@ def load_credentials(
     """
     Load service account credentials from environment or file.
 
+    Results are cached against the environment value or the file's mtime,
+    so repeat calls only re-parse when the credentials actually change.
+
     Args:
         env_var: Environment variable name containing JSON credentials
         file_path: Path to credentials file
@@ -70,11 +123,32 @@ def load_credentials(
     Returns:
         CredentialsResult with credentials dict or error info
     """
+    env_json = os.environ.get(env_var)
+    if env_json:
+        cache_key = ('env', env_var, env_json)
+    else:
+        try:
+            cache_key = ('file', file_path, os.stat(file_path).st_mtime_ns)
+        except OSError:
+            cache_key = None
+
+    if cache_key is not None and _CREDS_CACHE['key'] == cache_key:
+        return _CREDS_CACHE['result']
+
+    result = _read_credentials(env_var, file_path)
+    if cache_key is not None and result.source != 'missing':
+        _CREDS_CACHE['key'] = cache_key
+        _CREDS_CACHE['result'] = result
+    return result
+
+
+def _read_credentials(env_var: str, file_path: str) -> CredentialsResult:
+    """Read and parse credentials from environment or file, uncached."""
     # First try environment variable
     env_json = os.environ.get(env_var)
     if env_json:
         try:
-            creds_dict = json.loads(env_json)
+            creds_dict = _json_loads(env_json)
             return CredentialsResult(credentials=creds_dict, source='env')
         except json.JSONDecodeError as e:
             return CredentialsResult(
@@ -85,8 +159,8 @@ def load_credentials(
     # Fall back to file
     if os.path.exists(file_path):
         try:
-            with open(file_path, 'r') as f:
-                creds_dict = json.load(f)
+            with open(file_path, 'rb') as f:
+                creds_dict = _json_loads(f.read())
             return CredentialsResult(credentials=creds_dict, source='file')
         except json.JSONDecodeError as e:
             return CredentialsResult(
@@ -129,12 +203,36 @@ def create_service(
     if not delegated_email:
         return None
 
+    from googleapiclient.discovery import build
+    from googleapiclient.http import HttpRequest
+    from google.oauth2 import service_account
+
+    class RetryingHttpRequest(HttpRequest):
+        """HttpRequest that retries transient errors on reads unless told otherwise."""
+
+        def execute(self, http=None, num_retries=None):
+            if num_retries is None:
+                # A write the server applied before failing would come back
+                # as a spurious 409 or 404 if retried, so only GETs retry
+                num_retries = NUM_RETRIES if self.method == 'GET' else 0
+            return super().execute(http=http, num_retries=num_retries)
+
     credentials = service_account.Credentials.from_service_account_info(
         credentials_dict, scopes=SCOPES
     )
     delegated_credentials = credentials.with_subject(delegated_email)
 
-    return build('admin', 'directory_v1', credentials=delegated_credentials)
+    # One service shares a single keep-alive HTTP connection for all its calls,
+    # so callers should build it once and reuse it. The discovery document
+    # is loaded from the copy bundled with google-api-python-client, so
+    # building makes no network request.
+    return build(
+        'admin', 'directory_v1',
+        credentials=delegated_credentials,
+        cache_discovery=False,
+        static_discovery=True,
+        requestBuilder=RetryingHttpRequest
+    )
 
 
 def validate_group_name(group_name: str) -> ValidationResult:
@@ -161,7 +259,7 @@ def validate_group_name(group_name: str) -> ValidationResult:
         name, domain_from_email = parts
 
     # Check valid characters
-    if not re.match(r'^[a-zA-Z0-9.\-_]+$', name):
+    if not name or not _GROUP_NAME_CHARS.issuperset(name):
         return ValidationResult(
             valid=False,
             error=f"Group name '{name}' contains invalid characters. "
@@ -173,14 +271,59 @@ def validate_group_name(group_name: str) -> ValidationResult:
 
 def validate_email(email: str) -> bool:
     """Validate an email address format."""
-    return bool(re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email))
+    at = email.find('@')
+    if at < 1:
+        return False
+    local, domain = email[:at], email[at + 1:]
+
+    # Domain needs at least one character before the last dot and a TLD of 2+ letters
+    dot = domain.rfind('.')
+    if dot < 1 or len(domain) - dot - 1 < 2:
+        return False
+
+    return (
+        _LOCAL_CHARS.issuperset(local)
+        and _DOMAIN_CHARS.issuperset(domain)
+        and _TLD_CHARS.issuperset(domain[dot + 1:])
+    )
+
+
+def parse_email_list(text: str) -> tuple[list[str], list[str]]:
+    """
+    Parse a pasted list of email addresses separated by commas, semicolons
+    or whitespace.
+
+    Duplicates are dropped case-insensitively; the original order is kept.
+
+    Returns:
+        Tuple of (valid emails, invalid entries)
+    """
+    candidates = []
+    seen = set()
+
+    for email in _SPLIT_RE.split(text):
+        if not email:
+            continue
+        key = email.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        candidates.append(email)
+
+    # Validate all candidates in one regex pass instead of one call per address
+    valid = set(_EMAIL_LINE_RE.findall('\n'.join(candidates)))
+    valid_emails = [email for email in candidates if email in valid]
+    invalid = [email for email in candidates if email not in valid]
+
+    return valid_emails, invalid
 
 
 def create_group(
     service: Resource,
     group_name: str,
     domain: Optional[str] = None,
-    description: str = ""
+    description: str = "",
+    if_not_exists: bool = False
 ) -> OperationResult:
     """
     Create a new Google Group.
@@ -190,12 +333,25 @@ def create_group(
         group_name: Name of the group (without domain)
         domain: Domain for the group email
         description: Optional group description
+        if_not_exists: Succeed without creating anything if the group already
+            exists; data then has 'already_exists' set
 
     Returns:
         OperationResult with created group data
     """
-    domain_to_use = domain or DEFAULT_DOMAIN
-    email = f"{group_name}@{domain_to_use}"
+    email = build_group_email(group_name, domain)
+
+    if if_not_exists:
+        # A cheap lookup avoids a failing insert on re-runs
+        check = get_group(service, email, fields='email')
+        if check.success:
+            return OperationResult(
+                success=True,
+                message=f"Group '{email}' already exists",
+                data={'email': email, 'already_exists': True}
+            )
+        if check.error != "Group does not exist":
+            return check
 
     group_body = {
         "email": email,
@@ -225,27 +381,40 @@ def create_group(
         )
 
 
-def get_group(service: Resource, group_email: str) -> OperationResult:
+def _http_status(error: Exception) -> Optional[int]:
+    """Return the HTTP status code of a googleapiclient HttpError, or None."""
+    return getattr(getattr(error, 'resp', None), 'status', None)
+
+
+def get_group(
+    service: Resource,
+    group_email: str,
+    fields: Optional[str] = None
+) -> OperationResult:
     """
     Get a Google Group by email.
 
     Args:
         service: Google Directory API service
         group_email: Full email address of the group
+        fields: Optional partial-response field list, e.g. 'email'
 
     Returns:
         OperationResult with group data
     """
+    params = {'groupKey': group_email}
+    if fields:
+        params['fields'] = fields
+
     try:
-        result = service.groups().get(groupKey=group_email).execute()
+        result = service.groups().get(**params).execute()
         return OperationResult(
             success=True,
             message=f"Group '{group_email}' found",
             data=result
         )
     except Exception as e:
-        error_str = str(e)
-        if "Resource Not Found" in error_str:
+        if _http_status(e) == 404:
             return OperationResult(
                 success=False,
                 message=f"Group '{group_email}' not found",
@@ -254,34 +423,45 @@ def get_group(service: Resource, group_email: str) -> OperationResult:
         return OperationResult(
             success=False,
             message=f"Failed to get group '{group_email}'",
-            error=error_str
+            error=str(e)
         )
 
 
 def ensure_group_exists(
     service: Resource,
     group_email: str,
-    max_attempts: int = 3,
-    delay: float = 3.0
+    max_attempts: int = 7,
+    initial_delay: float = 0.2,
+    max_delay: float = 3.0
 ) -> bool:
     """
-    Check if a group exists and wait for propagation if needed.
+    Wait for a newly created group to become visible.
+
+    Retries with exponential backoff: initial_delay, doubling up to max_delay.
+    With the defaults a missing group takes about 9 seconds to report, so
+    plain existence checks should call get_group once instead.
 
     Args:
         service: Google Directory API service
         group_email: Full email address of the group
-        max_attempts: Maximum retries
-        delay: Seconds between retries
+        max_attempts: Maximum number of checks
+        initial_delay: Seconds to wait after the first failed check
+        max_delay: Upper bound on the wait between checks
 
     Returns:
         True if group exists, False otherwise
     """
+    delay = initial_delay
     for attempt in range(max_attempts):
-        result = get_group(service, group_email)
+        result = get_group(service, group_email, fields='email')
         if result.success:
             return True
+        if result.error != "Group does not exist":
+            # Only a 404 can clear up while the group propagates
+            return False
         if attempt < max_attempts - 1:
             time.sleep(delay)
+            delay = min(delay * 2, max_delay)
     return False
 
 
@@ -296,11 +476,6 @@ def delete_group(service: Resource, group_email: str) -> OperationResult:
     Returns:
         OperationResult indicating success/failure
     """
-    # First check if group exists
-    check = get_group(service, group_email)
-    if not check.success:
-        return check
-
     try:
         service.groups().delete(groupKey=group_email).execute()
         return OperationResult(
@@ -308,6 +483,12 @@ def delete_group(service: Resource, group_email: str) -> OperationResult:
             message=f"Group '{group_email}' deleted successfully"
         )
     except Exception as e:
+        if _http_status(e) == 404:
+            return OperationResult(
+                success=False,
+                message=f"Group '{group_email}' not found",
+                error="Group does not exist"
+            )
         return OperationResult(
             success=False,
             message=f"Failed to delete group '{group_email}'",
@@ -335,39 +516,39 @@ def update_group(
     Returns:
         OperationResult with updated group data
     """
-    check = get_group(service, group_email)
-    if not check.success:
-        return check
-
-    group = check.data
-    current_email = group.get('email', group_email)
-    current_name, current_domain = current_email.split('@')
+    current_name, current_domain = group_email.split('@')
     target_name = new_name or current_name
     target_domain = new_domain or current_domain
-    target_email = f"{target_name}@{target_domain}"
-
-    if target_email != current_email:
-        new_check = get_group(service, target_email)
-        if new_check.success:
-            return OperationResult(
-                success=False,
-                message=f"Cannot update: group '{target_email}' already exists",
-                error="Target group already exists"
-            )
+    target_email = build_group_email(target_name, target_domain)
 
+    # The API rejects a missing group with 404 and a taken address with 409,
+    # so no existence checks are needed before the patch
     try:
-        group['email'] = target_email
-        group['name'] = target_name
+        # Patch only the fields being changed
+        body = {'email': target_email, 'name': target_name}
         if description is not None:
-            group['description'] = description
+            body['description'] = description
 
-        result = service.groups().update(groupKey=current_email, body=group).execute()
+        result = service.groups().patch(groupKey=group_email, body=body).execute()
         return OperationResult(
             success=True,
-            message=f"Group '{current_email}' updated successfully",
+            message=f"Group '{group_email}' updated successfully",
             data=result
         )
     except Exception as e:
+        status = _http_status(e)
+        if status == 404:
+            return OperationResult(
+                success=False,
+                message=f"Group '{group_email}' not found",
+                error="Group does not exist"
+            )
+        if status == 409:
+            return OperationResult(
+                success=False,
+                message=f"Cannot update: group '{target_email}' already exists",
+                error="Target group already exists"
+            )
         return OperationResult(
             success=False,
             message="Failed to update group",
@@ -393,40 +574,34 @@ def rename_group(
     Returns:
         OperationResult with updated group data
     """
-    # Get current group
-    check = get_group(service, old_email)
-    if not check.success:
-        return check
-
-    # Determine new email
-    if new_domain:
-        new_email = f"{new_name}@{new_domain}"
-    else:
-        # Extract domain from old email
-        _, old_domain = old_email.split('@')
-        new_email = f"{new_name}@{old_domain}"
-
-    # Check if new email already exists
-    new_check = get_group(service, new_email)
-    if new_check.success:
-        return OperationResult(
-            success=False,
-            message=f"Cannot rename: group '{new_email}' already exists",
-            error="Target group already exists"
-        )
+    # Keep the old domain unless a new one is given
+    new_email = build_group_email(new_name, new_domain or old_email.split('@')[1])
 
+    # A missing group comes back as 404 and a taken address as 409
     try:
-        group = check.data
-        group['email'] = new_email
-        group['name'] = new_name
-
-        result = service.groups().update(groupKey=old_email, body=group).execute()
+        result = service.groups().patch(
+            groupKey=old_email,
+            body={'email': new_email, 'name': new_name}
+        ).execute()
         return OperationResult(
             success=True,
             message=f"Group renamed from '{old_email}' to '{new_email}'",
             data=result
         )
     except Exception as e:
+        status = _http_status(e)
+        if status == 404:
+            return OperationResult(
+                success=False,
+                message=f"Group '{old_email}' not found",
+                error="Group does not exist"
+            )
+        if status == 409:
+            return OperationResult(
+                success=False,
+                message=f"Cannot rename: group '{new_email}' already exists",
+                error="Target group already exists"
+            )
         return OperationResult(
             success=False,
             message=f"Failed to rename group",
@@ -434,11 +609,95 @@ def rename_group(
         )
 
 
+def _filter_groups(groups: list, query: Optional[str]) -> list:
+    """Keep groups whose email, name or description contains query."""
+    if not query:
+        return groups
+    query_lower = query.lower()
+    return [
+        g for g in groups
+        if (query_lower in g.get('email', '').lower() or
+            query_lower in g.get('name', '').lower() or
+            query_lower in g.get('description', '').lower())
+    ]
+
+
+def _use_local_filter(query: Optional[str], local_filter: bool) -> bool:
+    """
+    Decide whether query must be matched on the client.
+
+    A plain term is sent as an 'email:{query}*' prefix search, which the API
+    rejects if the term has characters outside a group name (spaces, '*',
+    quotes, '@', ...); such terms are filtered locally instead.
+    """
+    if local_filter or not query or ':' in query:
+        return local_filter
+    return not _GROUP_NAME_CHARS.issuperset(query)
+
+
+def _group_list_params(
+    domain: str,
+    query: Optional[str],
+    max_results: int,
+    local_filter: bool
+) -> dict:
+    """Build groups().list() arguments, sending query to the API unless filtering locally."""
+    params = {
+        'domain': domain,
+        'maxResults': max_results,
+        'fields': GROUP_LIST_FIELDS
+    }
+    if query and not local_filter:
+        # Plain terms become an email prefix search; API queries like 'name:Class*' pass through
+        params['query'] = query if ':' in query else f"email:{query}*"
+    return params
+
+
+def iter_groups(
+    service: Resource,
+    domain: Optional[str] = None,
+    query: Optional[str] = None,
+    max_results: int = MAX_PAGE_SIZE,
+    local_filter: bool = False
+) -> Iterator[dict]:
+    """
+    Yield Google Groups in a domain as each page arrives.
+
+    Groups come back in API order. API errors are raised to the caller
+    rather than wrapped in an OperationResult.
+
+    Args:
+        service: Google Directory API service
+        domain: Domain to list groups from
+        query: Optional search, sent to the API as an email prefix
+            (or as-is if it contains ':'); terms the API cannot take as
+            a prefix are matched locally as with local_filter
+        max_results: Maximum results per page
+        local_filter: Match query as a substring of email, name or
+            description on the client instead
+
+    Yields:
+        Group dicts
+    """
+    local_filter = _use_local_filter(query, local_filter)
+    groups_api = service.groups()
+    request = groups_api.list(**_group_list_params(
+        domain or DEFAULT_DOMAIN, query, max_results, local_filter
+    ))
+    local_query = query if local_filter else None
+
+    while request is not None:
+        results = request.execute()
+        yield from _filter_groups(results.get('groups', []), local_query)
+        request = groups_api.list_next(request, results)
+
+
 def list_groups(
     service: Resource,
     domain: Optional[str] = None,
     query: Optional[str] = None,
-    max_results: int = 100
+    max_results: int = MAX_PAGE_SIZE,
+    local_filter: bool = False
 ) -> OperationResult:
     """
     List Google Groups in a domain.
@@ -446,44 +705,20 @@ def list_groups(
     Args:
         service: Google Directory API service
         domain: Domain to list groups from
-        query: Optional filter string
+        query: Optional search, sent to the API as an email prefix
+            (or as-is if it contains ':'); terms the API cannot take as
+            a prefix are matched locally as with local_filter
         max_results: Maximum results per page
+        local_filter: Match query as a substring of email, name or
+            description on the client instead
 
     Returns:
         OperationResult with list of groups
     """
     domain_to_use = domain or DEFAULT_DOMAIN
-    groups = []
-    page_token = None
 
     try:
-        while True:
-            params = {
-                'domain': domain_to_use,
-                'maxResults': max_results
-            }
-            if page_token:
-                params['pageToken'] = page_token
-
-            results = service.groups().list(**params).execute()
-
-            if 'groups' in results:
-                if query:
-                    # Filter locally
-                    query_lower = query.lower()
-                    filtered = [
-                        g for g in results['groups']
-                        if (query_lower in g.get('email', '').lower() or
-                            query_lower in g.get('name', '').lower() or
-                            query_lower in g.get('description', '').lower())
-                    ]
-                    groups.extend(filtered)
-                else:
-                    groups.extend(results['groups'])
-
-            page_token = results.get('nextPageToken')
-            if not page_token:
-                break
+        groups = list(iter_groups(service, domain_to_use, query, max_results, local_filter))
 
         return OperationResult(
             success=True,
@@ -498,6 +733,127 @@ def list_groups(
         )
 
 
+def list_groups_in_domains(
+    service: Resource,
+    domains: list[str],
+    query: Optional[str] = None,
+    max_results: int = MAX_PAGE_SIZE,
+    local_filter: bool = False
+) -> dict[str, OperationResult]:
+    """
+    List Google Groups in several domains at once.
+
+    The page requests for all domains are sent together in one batch
+    request per round, so the total wait is the page count of the largest
+    domain rather than the sum over all domains.
+
+    Args:
+        service: Google Directory API service
+        domains: Domains to list groups from
+        query: Optional search, sent to the API as an email prefix
+            (or as-is if it contains ':'); terms the API cannot take as
+            a prefix are matched locally as with local_filter
+        max_results: Maximum results per page
+        local_filter: Match query as a substring of email, name or
+            description on the client instead
+
+    Returns:
+        OperationResult per domain, shaped like list_groups results
+    """
+    local_filter = _use_local_filter(query, local_filter)
+    groups_api = service.groups()
+    groups = {domain: [] for domain in domains}
+    errors = {}
+    pending = {
+        domain: groups_api.list(**_group_list_params(domain, query, max_results, local_filter))
+        for domain in domains
+    }
+    local_query = query if local_filter else None
+
+    while pending:
+        next_pending = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = str(exception)
+                return
+            groups[request_id].extend(_filter_groups(response.get('groups', []), local_query))
+            next_request = groups_api.list_next(pending[request_id], response)
+            if next_request is not None:
+                next_pending[request_id] = next_request
+
+        batch = service.new_batch_http_request(callback=on_response)
+        for domain, request in pending.items():
+            batch.add(request, request_id=domain)
+        try:
+            batch.execute()
+        except Exception as e:
+            for domain in pending:
+                errors[domain] = str(e)
+            next_pending.clear()
+        pending = next_pending
+
+    results = {}
+    for domain in domains:
+        if domain in errors:
+            results[domain] = OperationResult(
+                success=False,
+                message="Failed to list groups",
+                error=errors[domain]
+            )
+        else:
+            results[domain] = OperationResult(
+                success=True,
+                message=f"Found {len(groups[domain])} groups",
+                data={'groups': groups[domain], 'domain': domain}
+            )
+    return results
+
+
+def _member_insert_request(
+    service: Resource,
+    group_email: str,
+    member_email: str,
+    role: str = "MEMBER"
+):
+    """Build an unexecuted members.insert request for a single member."""
+    member_body = {
+        "email": member_email,
+        "role": role,
+        "delivery_settings": "ALL_MAIL"
+    }
+    return service.members().insert(groupKey=group_email, body=member_body)
+
+
+def _add_member_result(
+    group_email: str,
+    member_email: str,
+    role: str,
+    response: Optional[dict] = None,
+    error_str: Optional[str] = None
+) -> OperationResult:
+    """Turn a members.insert response or error into an OperationResult."""
+    if error_str is None:
+        return OperationResult(
+            success=True,
+            message=f"Added {member_email} to {group_email} as {role}",
+            data=response
+        )
+
+    if "Member already exists" in error_str:
+        return OperationResult(
+            success=False,
+            message=f"{member_email} is already a member of {group_email}",
+            error="Member already exists"
+        )
+
+    return OperationResult(
+        success=False,
+        message=f"Failed to add {member_email} to {group_email}",
+        error=error_str
+    )
+
+
 def add_member(
     service: Resource,
     group_email: str,
@@ -513,47 +869,94 @@ def add_member(
         group_email: Full email address of the group
         member_email: Email of member to add
         role: Role to assign (OWNER, MANAGER, MEMBER)
-        retry: Whether to retry if group not found
+        retry: Whether to retry, with backoff, if group not found
 
     Returns:
         OperationResult indicating success/failure
     """
-    member_body = {
-        "email": member_email,
-        "role": role,
-        "delivery_settings": "ALL_MAIL"
-    }
+    # An HttpRequest can be executed again, so build it once for every attempt
+    request = _member_insert_request(service, group_email, member_email, role)
+    delays = list(PROPAGATION_DELAYS) if retry else []
+    while True:
+        try:
+            result = request.execute()
+            return _add_member_result(group_email, member_email, role, response=result)
+        except Exception as e:
+            error_str = str(e)
+            if delays and "Resource Not Found: groupKey" in error_str:
+                # Group may still be propagating
+                time.sleep(delays.pop(0))
+                continue
+            return _add_member_result(group_email, member_email, role, error_str=error_str)
 
-    try:
-        result = service.members().insert(
-            groupKey=group_email,
-            body=member_body
-        ).execute()
-        return OperationResult(
-            success=True,
-            message=f"Added {member_email} to {group_email} as {role}",
-            data=result
-        )
-    except Exception as e:
-        error_str = str(e)
-        if retry and "Resource Not Found: groupKey" in error_str:
-            # Group may still be propagating
-            time.sleep(5)
-            return add_member(service, group_email, member_email, role, retry=False)
 
-        if "Member already exists" in error_str:
-            return OperationResult(
-                success=False,
-                message=f"{member_email} is already a member of {group_email}",
-                error="Member already exists"
-            )
+def add_members(
+    service: Resource,
+    group_email: str,
+    members: list[tuple[str, str]],
+    retry: bool = True
+) -> list[OperationResult]:
+    """
+    Add several members to a Google Group using batch requests.
 
-        return OperationResult(
-            success=False,
-            message=f"Failed to add {member_email} to {group_email}",
-            error=error_str
+    All inserts are sent in one HTTP round-trip per batch of up to
+    BATCH_LIMIT members, instead of one round-trip per member.
+
+    Args:
+        service: Google Directory API service
+        group_email: Full email address of the group
+        members: (email, role) pairs to add
+        retry: Whether to re-send, with backoff, members that failed
+            because the group was not found yet
+
+    Returns:
+        OperationResult for each member, in the same order as members
+    """
+    results: list[Optional[OperationResult]] = [None] * len(members)
+
+    def on_response(request_id, response, exception):
+        index = int(request_id)
+        member_email, role = members[index]
+        error_str = str(exception) if exception is not None else None
+        results[index] = _add_member_result(
+            group_email, member_email, role, response=response, error_str=error_str
         )
 
+    def send(indexes):
+        for start in range(0, len(indexes), BATCH_LIMIT):
+            chunk = indexes[start:start + BATCH_LIMIT]
+            batch = service.new_batch_http_request(callback=on_response)
+            for index in chunk:
+                member_email, role = members[index]
+                batch.add(
+                    _member_insert_request(service, group_email, member_email, role),
+                    request_id=str(index)
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                # The whole batch failed; report it against every member in it
+                for index in chunk:
+                    member_email, role = members[index]
+                    results[index] = _add_member_result(
+                        group_email, member_email, role, error_str=str(e)
+                    )
+
+    send(list(range(len(members))))
+
+    for delay in (PROPAGATION_DELAYS if retry else ()):
+        not_found = [
+            index for index, result in enumerate(results)
+            if not result.success and "Resource Not Found: groupKey" in (result.error or "")
+        ]
+        if not not_found:
+            break
+        # Group may still be propagating
+        time.sleep(delay)
+        send(not_found)
+
+    return results
+
 
 def remove_member(
     service: Resource,
@@ -576,36 +979,126 @@ def remove_member(
             groupKey=group_email,
             memberKey=member_email
         ).execute()
+        return _remove_member_result(group_email, member_email)
+    except Exception as e:
+        return _remove_member_result(group_email, member_email, error_str=str(e))
+
+
+def _remove_member_result(
+    group_email: str,
+    member_email: str,
+    error_str: Optional[str] = None
+) -> OperationResult:
+    """Map a members().delete() outcome to an OperationResult."""
+    if error_str is None:
         return OperationResult(
             success=True,
             message=f"Removed {member_email} from {group_email}"
         )
-    except Exception as e:
-        error_str = str(e)
-        if "Resource Not Found" in error_str:
-            if "memberKey" in error_str:
-                return OperationResult(
-                    success=False,
-                    message=f"{member_email} is not a member of {group_email}",
-                    error="Member not found"
-                )
+    if "Resource Not Found" in error_str:
+        if "memberKey" in error_str:
             return OperationResult(
                 success=False,
-                message=f"Group {group_email} not found",
-                error="Group not found"
+                message=f"{member_email} is not a member of {group_email}",
+                error="Member not found"
             )
         return OperationResult(
             success=False,
-            message=f"Failed to remove {member_email} from {group_email}",
-            error=error_str
+            message=f"Group {group_email} not found",
+            error="Group not found"
         )
+    return OperationResult(
+        success=False,
+        message=f"Failed to remove {member_email} from {group_email}",
+        error=error_str
+    )
+
+
+def remove_members(
+    service: Resource,
+    group_email: str,
+    member_emails: list[str]
+) -> list[OperationResult]:
+    """
+    Remove several members from a Google Group using batch requests.
+
+    Args:
+        service: Google Directory API service
+        group_email: Full email address of the group
+        member_emails: Emails of members to remove
+
+    Returns:
+        OperationResult for each member, in the same order as member_emails
+    """
+    results: list[Optional[OperationResult]] = [None] * len(member_emails)
+
+    def on_response(request_id, response, exception):
+        index = int(request_id)
+        error_str = str(exception) if exception is not None else None
+        results[index] = _remove_member_result(
+            group_email, member_emails[index], error_str=error_str
+        )
+
+    for start in range(0, len(member_emails), BATCH_LIMIT):
+        chunk = range(start, min(start + BATCH_LIMIT, len(member_emails)))
+        batch = service.new_batch_http_request(callback=on_response)
+        for index in chunk:
+            batch.add(
+                service.members().delete(groupKey=group_email, memberKey=member_emails[index]),
+                request_id=str(index)
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            # The whole batch failed; report it against every member in it
+            for index in chunk:
+                results[index] = _remove_member_result(
+                    group_email, member_emails[index], error_str=str(e)
+                )
+
+    return results
+
+
+def iter_members(
+    service: Resource,
+    group_email: str,
+    include_derived: bool = False,
+    max_results: int = MAX_PAGE_SIZE
+) -> Iterator[dict]:
+    """
+    Yield members of a Google Group as each page arrives.
+
+    Members come back in API order. API errors are raised to the caller
+    rather than wrapped in an OperationResult.
+
+    Args:
+        service: Google Directory API service
+        group_email: Full email address of the group
+        include_derived: Include members from nested groups
+        max_results: Maximum results per page
+
+    Yields:
+        Member dicts
+    """
+    members_api = service.members()
+    request = members_api.list(
+        groupKey=group_email,
+        maxResults=max_results,
+        includeDerivedMembership=include_derived,
+        fields=MEMBER_LIST_FIELDS
+    )
+
+    while request is not None:
+        results = request.execute()
+        yield from results.get('members', [])
+        request = members_api.list_next(request, results)
 
 
 def list_members(
     service: Resource,
     group_email: str,
     include_derived: bool = False,
-    max_results: int = 100
+    max_results: int = MAX_PAGE_SIZE
 ) -> OperationResult:
     """
     List members of a Google Group.
@@ -619,39 +1112,18 @@ def list_members(
     Returns:
         OperationResult with list of members
     """
-    members = []
-    page_token = None
-
     try:
-        while True:
-            params = {
-                'groupKey': group_email,
-                'maxResults': max_results,
-                'includeDerivedMembership': include_derived
-            }
-            if page_token:
-                params['pageToken'] = page_token
-
-            results = service.members().list(**params).execute()
-
-            if 'members' in results:
-                members.extend(results['members'])
-
-            page_token = results.get('nextPageToken')
-            if not page_token:
-                break
+        members = list(iter_members(service, group_email, include_derived, max_results))
 
-        # Sort by role
-        role_order = {'OWNER': 0, 'MANAGER': 1, 'MEMBER': 2}
+        # Sort by role, then email; the key is computed once per member
         members.sort(key=lambda m: (
-            role_order.get(m.get('role', 'MEMBER'), 3),
+            _ROLE_ORDER.get(m.get('role', 'MEMBER'), len(MEMBER_ROLES)),
             m.get('email', '')
         ))
 
-        # Count by role
-        owners = sum(1 for m in members if m.get('role') == 'OWNER')
-        managers = sum(1 for m in members if m.get('role') == 'MANAGER')
-        regular = sum(1 for m in members if m.get('role') == 'MEMBER')
+        # Count by role in a single pass
+        counts = Counter(m.get('role', 'MEMBER') for m in members)
+        owners, managers, regular = counts['OWNER'], counts['MANAGER'], counts['MEMBER']
 
         return OperationResult(
             success=True,
@@ -668,8 +1140,7 @@ def list_members(
             }
         )
     except Exception as e:
-        error_str = str(e)
-        if "Resource Not Found" in error_str:
+        if _http_status(e) == 404:
             return OperationResult(
                 success=False,
                 message=f"Group {group_email} not found",
@@ -678,7 +1149,7 @@ def list_members(
         return OperationResult(
             success=False,
             message=f"Failed to list members of {group_email}",
-            error=error_str
+            error=str(e)
         )
 
 
@@ -700,7 +1171,7 @@ def update_member_role(
     Returns:
         OperationResult indicating success/failure
     """
-    if new_role not in ('OWNER', 'MANAGER', 'MEMBER'):
+    if new_role not in VALID_ROLES:
         return OperationResult(
             success=False,
             message=f"Invalid role: {new_role}",
@@ -0,0 +1,206 @@
+"""
+In-memory stand-in for the Google Directory API service.
+
+Implements only the groups() and members() calls that groupmaker_core makes,
+including list_next() paging and batch requests, and raises real
+googleapiclient HttpErrors so error handling is exercised as in production.
+"""
+
+import json
+from typing import Optional
+
+from googleapiclient.errors import HttpError
+from httplib2 import Response
+
+
+def http_error(status: int, message: str) -> HttpError:
+    """Build an HttpError shaped like a Directory API error response."""
+    body = json.dumps({
+        'error': {'code': status, 'message': message, 'errors': [{'message': message}]}
+    }).encode()
+    return HttpError(Response({'status': status}), body, uri='https://admin.googleapis.com/fake')
+
+
+class FakeRequest:
+    """A prepared call; like HttpRequest it can be executed more than once."""
+
+    def __init__(self, service: 'FakeService', method, kwargs: dict):
+        self.service = service
+        self.method = method
+        self.kwargs = kwargs
+
+    def execute(self, http=None, num_retries=0):
+        self.service.calls.append((self.method.__name__, self.kwargs))
+        return self.method(**self.kwargs)
+
+
+class FakeBatch:
+    """Runs its requests in order and reports each one to a callback."""
+
+    def __init__(self, service: 'FakeService', callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request: FakeRequest, callback=None, request_id: Optional[str] = None):
+        self.requests.append((request, callback or self.callback, request_id or str(len(self.requests))))
+
+    def execute(self, http=None):
+        self.service.batches += 1
+        for request, callback, request_id in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            callback(request_id, response, exception)
+
+
+class _Collection:
+    """Maps API method names to FakeService handlers."""
+
+    def __init__(self, service: 'FakeService', methods: dict):
+        self._service = service
+        self._methods = methods
+
+    def __getattr__(self, name):
+        method = self._methods[name]
+        return lambda **kwargs: FakeRequest(self._service, method, kwargs)
+
+    def list_next(self, previous: FakeRequest, response: dict) -> Optional[FakeRequest]:
+        token = response.get('nextPageToken')
+        if not token:
+            return None
+        return FakeRequest(self._service, previous.method, {**previous.kwargs, 'pageToken': token})
+
+
+class FakeService:
+    """
+    Directory API service backed by dicts.
+
+    Attributes:
+        groups_db: Group email -> group resource
+        members_db: Group email -> {member email: member resource}
+        calls: (method name, kwargs) for every executed request
+        batches: Number of batch requests executed
+        hidden: Group emails that return 404 for this many more calls,
+            to simulate a new group that is still propagating
+        errors: Group email -> HTTP status raised by every call on it
+    """
+
+    def __init__(self, page_size: int = 2):
+        self.groups_db: dict = {}
+        self.members_db: dict = {}
+        self.calls: list = []
+        self.batches = 0
+        self.page_size = page_size
+        self.hidden: dict = {}
+        self.errors: dict = {}
+
+    def add_group(self, email: str, name: str = '', description: str = '') -> None:
+        self.groups_db[email] = {'email': email, 'name': name or email.split('@')[0],
+                                 'description': description}
+        self.members_db[email] = {}
+
+    def groups(self) -> _Collection:
+        return _Collection(self, {
+            'get': self._get_group, 'insert': self._insert_group,
+            'delete': self._delete_group, 'patch': self._patch_group,
+            'list': self._list_groups,
+        })
+
+    def members(self) -> _Collection:
+        return _Collection(self, {
+            'insert': self._insert_member, 'delete': self._delete_member,
+            'update': self._update_member, 'list': self._list_members,
+        })
+
+    def new_batch_http_request(self, callback=None) -> FakeBatch:
+        return FakeBatch(self, callback)
+
+    def _page(self, items: list, key: str, maxResults: int, pageToken: Optional[str]) -> dict:
+        start = int(pageToken or 0)
+        end = start + min(maxResults, self.page_size)
+        response = {}
+        if items[start:end]:
+            response[key] = items[start:end]
+        if end < len(items):
+            response['nextPageToken'] = str(end)
+        return response
+
+    def _check_group(self, groupKey: str) -> None:
+        if groupKey in self.errors:
+            raise http_error(self.errors[groupKey], 'Not Authorized to access this resource/api')
+        if self.hidden.get(groupKey):
+            self.hidden[groupKey] -= 1
+            raise http_error(404, 'Resource Not Found: groupKey')
+        if groupKey not in self.groups_db:
+            raise http_error(404, 'Resource Not Found: groupKey')
+
+    # groups()
+
+    def _get_group(self, groupKey, fields=None):
+        self._check_group(groupKey)
+        return dict(self.groups_db[groupKey])
+
+    def _insert_group(self, body):
+        if body['email'] in self.groups_db:
+            raise http_error(409, 'Entity already exists.')
+        self.add_group(body['email'], body.get('name', ''), body.get('description', ''))
+        return dict(self.groups_db[body['email']])
+
+    def _delete_group(self, groupKey):
+        self._check_group(groupKey)
+        del self.groups_db[groupKey]
+        del self.members_db[groupKey]
+        return ''
+
+    def _patch_group(self, groupKey, body):
+        self._check_group(groupKey)
+        new_email = body.get('email', groupKey)
+        if new_email != groupKey and new_email in self.groups_db:
+            raise http_error(409, 'Entity already exists.')
+        group = {**self.groups_db.pop(groupKey), **body}
+        self.groups_db[new_email] = group
+        self.members_db[new_email] = self.members_db.pop(groupKey)
+        return dict(group)
+
+    def _list_groups(self, domain, maxResults=200, pageToken=None, query=None, fields=None):
+        groups = sorted(
+            (g for g in self.groups_db.values() if g['email'].endswith('@' + domain)),
+            key=lambda g: g['email']
+        )
+        if query:
+            field, _, value = query.partition(':')
+            if field != 'email' or not value.endswith('*'):
+                raise http_error(400, 'Invalid Input')
+            groups = [g for g in groups if g['email'].startswith(value[:-1])]
+        return self._page(groups, 'groups', maxResults, pageToken)
+
+    # members()
+
+    def _insert_member(self, groupKey, body, fields=None):
+        self._check_group(groupKey)
+        if body['email'] in self.members_db[groupKey]:
+            raise http_error(409, 'Member already exists.')
+        member = {'email': body['email'], 'role': body['role'], 'type': 'USER', 'status': 'ACTIVE'}
+        self.members_db[groupKey][body['email']] = member
+        return dict(member)
+
+    def _delete_member(self, groupKey, memberKey):
+        self._check_group(groupKey)
+        if memberKey not in self.members_db[groupKey]:
+            raise http_error(404, 'Resource Not Found: memberKey')
+        del self.members_db[groupKey][memberKey]
+        return ''
+
+    def _update_member(self, groupKey, memberKey, body):
+        self._check_group(groupKey)
+        if memberKey not in self.members_db[groupKey]:
+            raise http_error(404, 'Resource Not Found: memberKey')
+        self.members_db[groupKey][memberKey].update(body)
+        return dict(self.members_db[groupKey][memberKey])
+
+    def _list_members(self, groupKey, maxResults=200, pageToken=None, includeDerivedMembership=False,
+                      fields=None):
+        self._check_group(groupKey)
+        return self._page(list(self.members_db[groupKey].values()), 'members', maxResults, pageToken)
@@ -0,0 +1,215 @@
+"""Tests for the groupmaker CLI command handlers."""
+
+import argparse
+import io
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import groupmaker
+import groupmaker_core as core
+from tests.fake_service import FakeService
+
+GROUP = 'class-a@example.com'
+
+
+def write_file(test: unittest.TestCase, content: bytes) -> str:
+    """Write content to a temporary file that is removed after the test."""
+    fd, path = tempfile.mkstemp()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content)
+    test.addCleanup(os.remove, path)
+    return path
+
+
+class ReadEmailFileTest(unittest.TestCase):
+
+    def test_reads_valid_and_skips_invalid(self):
+        path = write_file(self, b"a@x.com\nnot-an-email, b@x.com\n")
+        with self.assertLogs('groupmaker', 'WARNING') as logs:
+            self.assertEqual(groupmaker.read_email_file(path), ['a@x.com', 'b@x.com'])
+        self.assertIn("Skipping invalid email address 'not-an-email'", logs.output[0])
+
+    def test_missing_file(self):
+        with self.assertLogs('groupmaker', 'ERROR') as logs:
+            self.assertEqual(groupmaker.read_email_file('/nonexistent/members.txt'), [])
+        self.assertIn("Could not read /nonexistent/members.txt", logs.output[0])
+
+    def test_binary_file_is_reported_not_raised(self):
+        path = write_file(self, b"\x89PNG\r\n\x1a\n\xff\xfe\x00")
+        with self.assertLogs('groupmaker', 'ERROR') as logs:
+            self.assertEqual(groupmaker.read_email_file(path), [])
+        self.assertIn(f"Could not read {path}", logs.output[0])
+
+
+class CommandTestCase(unittest.TestCase):
+    """Provides self.service with GROUP created and time.sleep recorded."""
+
+    def setUp(self):
+        self.service = FakeService()
+        self.service.add_group(GROUP)
+        self.sleeps = []
+        patcher = mock.patch.object(core.time, 'sleep', self.sleeps.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_command(self, handler, **kwargs):
+        handler(argparse.Namespace(**kwargs), self.service, 'example.com')
+
+
+class GroupCheckTest(CommandTestCase):
+    """Commands on an existing group check it once instead of polling."""
+
+    def test_add_to_missing_group_fails_without_waiting(self):
+        with self.assertLogs('groupmaker', 'ERROR') as logs:
+            self.run_command(groupmaker.cmd_add, group_name='missing',
+                             member_email='a@x.com', role='MEMBER')
+        self.assertIn("Group missing@example.com not found", logs.output[0])
+        self.assertEqual(len(self.service.calls), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_remove_from_missing_group_fails_without_waiting(self):
+        with self.assertLogs('groupmaker', 'ERROR'):
+            self.run_command(groupmaker.cmd_remove, group_name='missing', member_email='a@x.com')
+        self.assertEqual(len(self.service.calls), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_add(self):
+        self.run_command(groupmaker.cmd_add, group_name='class-a',
+                         member_email='a@x.com', role='MANAGER')
+        self.assertEqual(self.service.members_db[GROUP]['a@x.com']['role'], 'MANAGER')
+
+    def test_create_waits_for_new_group(self):
+        # Only create polls, because a brand-new group may not be visible yet
+        self.service.hidden['new-class@example.com'] = 1
+        self.run_command(groupmaker.cmd_create, group_name='new-class', trainer_email='t@x.com',
+                         description='', if_not_exists=False, skip_self=True, self_email=None)
+        self.assertEqual(self.sleeps, [0.2])
+        self.assertIn('t@x.com', self.service.members_db['new-class@example.com'])
+
+
+class BulkCommandTest(CommandTestCase):
+
+    def test_add_bulk(self):
+        path = write_file(self, b"a@x.com, b@x.com\nbad\n")
+        with self.assertLogs('groupmaker', 'INFO') as logs:
+            self.run_command(groupmaker.cmd_add_bulk, group_name='class-a', file=path, role='MEMBER')
+        self.assertEqual(list(self.service.members_db[GROUP]), ['a@x.com', 'b@x.com'])
+        self.assertEqual(self.service.batches, 1)
+        self.assertIn("Added 2 of 2 members.", logs.output[-1])
+
+    def test_remove_bulk(self):
+        for email in ('a@x.com', 'b@x.com', 'c@x.com'):
+            self.service.members_db[GROUP][email] = {'email': email, 'role': 'MEMBER'}
+        path = write_file(self, b"a@x.com\nc@x.com\nnobody@x.com\n")
+
+        with self.assertLogs('groupmaker', 'INFO') as logs:
+            self.run_command(groupmaker.cmd_remove_bulk, group_name='class-a', file=path)
+
+        self.assertEqual(list(self.service.members_db[GROUP]), ['b@x.com'])
+        self.assertEqual(self.service.batches, 1)
+        self.assertIn("nobody@x.com is not a member of class-a@example.com", '\n'.join(logs.output))
+        self.assertIn("Removed 2 of 3 members.", logs.output[-1])
+
+    def test_remove_bulk_unreadable_file_makes_no_calls(self):
+        with self.assertLogs('groupmaker', 'ERROR'):
+            self.run_command(groupmaker.cmd_remove_bulk, group_name='class-a',
+                             file='/nonexistent/members.txt')
+        self.assertEqual(self.service.calls, [])
+
+
+class MemberEmailValidationTest(CommandTestCase):
+    """An invalid member address is rejected before the service is built."""
+
+    def run_lazy(self, handler, **kwargs):
+        with mock.patch.object(core, 'create_service') as create_service:
+            with self.assertLogs('groupmaker', 'ERROR') as logs:
+                handler(argparse.Namespace(**kwargs), groupmaker.LazyService({}), 'example.com')
+        create_service.assert_not_called()
+        return logs.output
+
+    def test_add_invalid_email(self):
+        output = self.run_lazy(groupmaker.cmd_add, group_name='class-a',
+                               member_email='not-an-email', role='MEMBER')
+        self.assertIn("Invalid email address 'not-an-email'", output[0])
+
+    def test_remove_invalid_email(self):
+        output = self.run_lazy(groupmaker.cmd_remove, group_name='class-a',
+                               member_email='a@b@x.com')
+        self.assertIn("Invalid email address 'a@b@x.com'", output[0])
+
+
+class ReplTest(CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+        root = logging.getLogger()
+        self.addCleanup(root.setLevel, root.level)
+        self.addCleanup(setattr, root, 'handlers', root.handlers[:])
+        self.addCleanup(groupmaker.logger.setLevel, groupmaker.logger.level)
+        self.parser = groupmaker.build_parser()
+
+    def run_repl(self, lines, service=None, **kwargs) -> int:
+        """Run a session on lines, returning how many prompts were shown."""
+        with mock.patch('builtins.input', side_effect=lines + [EOFError()]) as prompt, \
+                mock.patch('sys.stdout', io.StringIO()), mock.patch('sys.stderr', io.StringIO()):
+            groupmaker.run_repl(self.parser, service or self.service, 'example.com', **kwargs)
+        return prompt.call_count
+
+    def record_levels(self):
+        levels = []
+
+        def handler(args, service, domain):
+            levels.append((groupmaker.logger.level, logging.getLogger().level))
+
+        patcher = mock.patch.dict(groupmaker.COMMANDS, {'list': handler})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return levels
+
+    def test_runs_commands_until_exit(self):
+        prompts = self.run_repl(['add class-a a@x.com', 'exit', 'add class-a b@x.com'])
+        self.assertEqual(prompts, 2)
+        self.assertEqual(list(self.service.members_db[GROUP]), ['a@x.com'])
+
+    def test_usage_errors_do_not_end_session(self):
+        self.assertEqual(self.run_repl(['bogus', 'add class-a', 'create bad/name t@x.com']), 4)
+
+    def test_service_build_failure_does_not_end_session(self):
+        with mock.patch.object(core, 'create_service', return_value=None) as create_service:
+            prompts = self.run_repl(['list', 'list'], service=groupmaker.LazyService({}))
+        self.assertEqual(prompts, 3)
+        self.assertEqual(create_service.call_count, 2)
+
+    def test_eof_at_command_prompt_abandons_command(self):
+        # input() serves both the repl prompt and delete's confirmation prompt
+        prompts = self.run_repl(['delete class-a', EOFError(), 'list'])
+        self.assertEqual(prompts, 4)
+        self.assertIn(GROUP, self.service.groups_db)
+        self.assertIn(('_list_groups', mock.ANY), self.service.calls)
+
+    def test_nested_repl_is_rejected(self):
+        with self.assertLogs('groupmaker', 'ERROR') as logs:
+            self.run_repl(['repl'])
+        self.assertIn("Already in a repl session", logs.output[0])
+
+    def test_line_verbosity_applies_to_that_line(self):
+        levels = self.record_levels()
+        self.run_repl(['-v list', 'list', '-q list'])
+        self.assertEqual(levels, [
+            (logging.DEBUG, logging.DEBUG),
+            (logging.INFO, logging.WARNING),
+            (logging.WARNING, logging.WARNING),
+        ])
+
+    def test_session_verbosity_is_the_default(self):
+        levels = self.record_levels()
+        self.run_repl(['list', '-v list', 'list'], quiet=True)
+        self.assertEqual([logger_level for logger_level, _ in levels],
+                         [logging.WARNING, logging.DEBUG, logging.WARNING])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,326 @@
+"""Tests for groupmaker_core, run against the in-memory FakeService."""
+
+import unittest
+from unittest import mock
+
+import groupmaker_core as core
+from tests.fake_service import FakeService
+
+# Only needed to sign throwaway service account credentials
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+except ImportError:
+    rsa = None
+
+GROUP = 'class-a@example.com'
+
+
+VALID_EMAILS = [
+    'a@b.co',
+    'first.last+tag@sub.example.org',
+    'A_B-c@EX-ample.COM',
+    '100%@example.com',
+]
+
+INVALID_EMAILS = [
+    '',
+    '@example.com',
+    'user@',
+    'user@example',
+    'user@.com',
+    'user@example.c',
+    'user@example.c0m',
+    'user@example.com.',
+    'two words@example.com',
+    'a@b@example.com',
+    'user@exa_mple.com',
+    'usér@example.com',
+]
+
+
+class ValidateEmailTest(unittest.TestCase):
+
+    def test_valid(self):
+        for email in VALID_EMAILS:
+            with self.subTest(email=email):
+                self.assertTrue(core.validate_email(email))
+
+    def test_invalid(self):
+        for email in INVALID_EMAILS:
+            with self.subTest(email=email):
+                self.assertFalse(core.validate_email(email))
+
+
+class ParseEmailListTest(unittest.TestCase):
+
+    def test_separators(self):
+        emails, invalid = core.parse_email_list("a@x.com, b@x.com;c@x.com\n\td@x.com  e@x.com,,")
+        self.assertEqual(emails, ['a@x.com', 'b@x.com', 'c@x.com', 'd@x.com', 'e@x.com'])
+        self.assertEqual(invalid, [])
+
+    def test_empty(self):
+        self.assertEqual(core.parse_email_list(''), ([], []))
+        self.assertEqual(core.parse_email_list(' \n,; '), ([], []))
+
+    def test_duplicates_dropped_case_insensitively(self):
+        emails, _ = core.parse_email_list("A@x.com a@x.com b@x.com A@X.COM")
+        self.assertEqual(emails, ['A@x.com', 'b@x.com'])
+
+    def test_invalid_entries_kept_in_order(self):
+        emails, invalid = core.parse_email_list("bad a@x.com worse@ bad")
+        self.assertEqual(emails, ['a@x.com'])
+        self.assertEqual(invalid, ['bad', 'worse@'])
+
+    def test_agrees_with_validate_email(self):
+        # parse_email_list validates with one regex pass; it must match validate_email
+        tokens = [e for e in INVALID_EMAILS if e and ' ' not in e]
+        emails, invalid = core.parse_email_list(' '.join(VALID_EMAILS + tokens))
+        self.assertEqual(emails, VALID_EMAILS)
+        self.assertEqual(invalid, tokens)
+
+
+class FakeServiceTestCase(unittest.TestCase):
+    """Provides self.service with GROUP created and time.sleep recorded."""
+
+    def setUp(self):
+        self.service = FakeService()
+        self.service.add_group(GROUP)
+        self.sleeps = []
+        patcher = mock.patch.object(core.time, 'sleep', self.sleeps.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class AddMembersTest(FakeServiceTestCase):
+
+    def test_results_in_order_from_one_batch(self):
+        self.service.members_db[GROUP]['b@x.com'] = {'email': 'b@x.com', 'role': 'MEMBER'}
+
+        results = core.add_members(self.service, GROUP, [
+            ('a@x.com', 'MEMBER'), ('b@x.com', 'MEMBER'), ('c@x.com', 'MANAGER'),
+        ])
+
+        self.assertEqual([r.success for r in results], [True, False, True])
+        self.assertEqual(results[1].error, "Member already exists")
+        self.assertEqual(self.service.members_db[GROUP]['c@x.com']['role'], 'MANAGER')
+        self.assertEqual(self.service.batches, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_splits_batches_at_limit(self):
+        with mock.patch.object(core, 'BATCH_LIMIT', 2):
+            results = core.add_members(self.service, GROUP, [
+                ('a@x.com', 'MEMBER'), ('b@x.com', 'MEMBER'), ('c@x.com', 'MEMBER'),
+            ])
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(self.service.batches, 2)
+
+    def test_resends_only_group_not_found_failures(self):
+        # The first two inserts see a group that has not propagated yet
+        self.service.hidden[GROUP] = 2
+        self.service.members_db[GROUP]['c@x.com'] = {'email': 'c@x.com', 'role': 'MEMBER'}
+
+        results = core.add_members(self.service, GROUP, [
+            ('a@x.com', 'MEMBER'), ('b@x.com', 'MEMBER'), ('c@x.com', 'MEMBER'),
+        ])
+
+        self.assertEqual([r.success for r in results], [True, True, False])
+        self.assertEqual(results[2].error, "Member already exists")
+        self.assertEqual(self.service.batches, 2)
+        self.assertEqual(len(self.service.calls), 5)
+        self.assertEqual(self.sleeps, [core.PROPAGATION_DELAYS[0]])
+
+    def test_gives_up_after_propagation_delays(self):
+        results = core.add_members(self.service, 'missing@example.com', [('a@x.com', 'MEMBER')])
+
+        self.assertFalse(results[0].success)
+        self.assertIn("Resource Not Found: groupKey", results[0].error)
+        self.assertEqual(self.sleeps, list(core.PROPAGATION_DELAYS))
+
+    def test_no_retry(self):
+        results = core.add_members(
+            self.service, 'missing@example.com', [('a@x.com', 'MEMBER')], retry=False
+        )
+        self.assertFalse(results[0].success)
+        self.assertEqual(self.service.batches, 1)
+        self.assertEqual(self.sleeps, [])
+
+
+class RemoveMembersTest(FakeServiceTestCase):
+
+    def test_results_in_order(self):
+        self.service.members_db[GROUP]['a@x.com'] = {'email': 'a@x.com', 'role': 'MEMBER'}
+
+        results = core.remove_members(self.service, GROUP, ['nobody@x.com', 'a@x.com'])
+
+        self.assertEqual([r.success for r in results], [False, True])
+        self.assertEqual(results[0].error, "Member not found")
+        self.assertEqual(self.service.members_db[GROUP], {})
+        self.assertEqual(self.service.batches, 1)
+
+    def test_missing_group(self):
+        results = core.remove_members(self.service, 'missing@example.com', ['a@x.com'])
+        self.assertEqual(results[0].error, "Group not found")
+
+    def test_splits_batches_at_limit(self):
+        with mock.patch.object(core, 'BATCH_LIMIT', 2):
+            core.remove_members(self.service, GROUP, ['a@x.com', 'b@x.com', 'c@x.com'])
+        self.assertEqual(self.service.batches, 2)
+
+
+class ListMembersTest(FakeServiceTestCase):
+
+    def test_sorted_by_role_across_pages(self):
+        members = self.service.members_db[GROUP]
+        members['m@x.com'] = {'email': 'm@x.com', 'role': 'MEMBER'}
+        members['o@x.com'] = {'email': 'o@x.com', 'role': 'OWNER'}
+        members['g@x.com'] = {'email': 'g@x.com', 'role': 'MANAGER'}
+
+        result = core.list_members(self.service, GROUP)
+
+        self.assertTrue(result.success)
+        self.assertEqual([m['email'] for m in result.data['members']], ['o@x.com', 'g@x.com', 'm@x.com'])
+        self.assertEqual(result.data['summary'], {'owners': 1, 'managers': 1, 'members': 1, 'total': 3})
+
+    def test_member_without_role_counts_as_member(self):
+        self.service.members_db[GROUP]['a@x.com'] = {'email': 'a@x.com', 'role': 'MEMBER'}
+        self.service.members_db[GROUP]['b@x.com'] = {'email': 'b@x.com'}
+
+        result = core.list_members(self.service, GROUP)
+
+        self.assertEqual(result.data['summary']['members'], 2)
+
+    def test_missing_group(self):
+        result = core.list_members(self.service, 'missing@example.com')
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "Group not found")
+
+
+class EnsureGroupExistsTest(FakeServiceTestCase):
+
+    def test_existing_group(self):
+        self.assertTrue(core.ensure_group_exists(self.service, GROUP))
+        self.assertEqual(self.sleeps, [])
+
+    def test_waits_for_propagation(self):
+        self.service.hidden[GROUP] = 2
+        self.assertTrue(core.ensure_group_exists(self.service, GROUP))
+        self.assertEqual(self.sleeps, [0.2, 0.4])
+
+    def test_backoff_is_capped(self):
+        self.assertFalse(core.ensure_group_exists(self.service, 'missing@example.com'))
+        self.assertEqual(self.sleeps, [0.2, 0.4, 0.8, 1.6, 3.0, 3.0])
+
+    def test_stops_on_non_404_error(self):
+        self.service.errors[GROUP] = 403
+        self.assertFalse(core.ensure_group_exists(self.service, GROUP))
+        self.assertEqual(len(self.service.calls), 1)
+        self.assertEqual(self.sleeps, [])
+
+
+class GroupListQueryTest(unittest.TestCase):
+
+    def params(self, query, local_filter=False):
+        local_filter = core._use_local_filter(query, local_filter)
+        return core._group_list_params('example.com', query, 200, local_filter).get('query')
+
+    def test_plain_term_is_email_prefix(self):
+        self.assertEqual(self.params('class-a'), 'email:class-a*')
+        self.assertEqual(self.params('Class_A.2023'), 'email:Class_A.2023*')
+
+    def test_api_query_passes_through(self):
+        self.assertEqual(self.params('name:Class*'), 'name:Class*')
+        self.assertEqual(self.params("name:'Class A'"), "name:'Class A'")
+
+    def test_no_query(self):
+        self.assertIsNone(self.params(None))
+        self.assertIsNone(self.params(''))
+
+    def test_local_filter_sends_no_query(self):
+        self.assertIsNone(self.params('class', local_filter=True))
+
+    def test_terms_the_api_cannot_prefix_match_are_filtered_locally(self):
+        for query in ('class a', 'class*', '"class"', "o'brien", 'class-a@example.com'):
+            with self.subTest(query=query):
+                self.assertTrue(core._use_local_filter(query, False))
+                self.assertIsNone(self.params(query))
+
+
+class ListGroupsTest(FakeServiceTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.service.add_group('class-b@example.com', name='Class B', description='Robotics class')
+        self.service.add_group('other@example.com', name='Other')
+
+    def emails(self, result):
+        self.assertTrue(result.success, result.error)
+        return [g['email'] for g in result.data['groups']]
+
+    def test_prefix_query_across_pages(self):
+        self.service.add_group('class-c@example.com')
+        result = core.list_groups(self.service, 'example.com', query='class')
+        self.assertEqual(self.emails(result), [GROUP, 'class-b@example.com', 'class-c@example.com'])
+
+    def test_query_with_spaces_is_filtered_locally(self):
+        result = core.list_groups(self.service, 'example.com', query='robotics class')
+        self.assertEqual(self.emails(result), ['class-b@example.com'])
+        self.assertNotIn('query', self.service.calls[0][1])
+
+    def test_in_domains_query_with_spaces_is_filtered_locally(self):
+        results = core.list_groups_in_domains(self.service, ['example.com'], query='class b')
+        self.assertEqual(self.emails(results['example.com']), ['class-b@example.com'])
+
+
+@unittest.skipIf(rsa is None, "cryptography is not installed")
+class CreateServiceRetryTest(unittest.TestCase):
+    """Checks the num_retries each real request would be executed with."""
+
+    @classmethod
+    def setUpClass(cls):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ).decode()
+        cls.service = core.create_service({
+            'type': 'service_account',
+            'client_email': 'groupmaker@example.iam.gserviceaccount.com',
+            'private_key': pem,
+            'token_uri': 'https://oauth2.googleapis.com/token',
+        }, admin_email='admin@example.com')
+
+    def num_retries(self, request, **kwargs):
+        from googleapiclient.http import HttpRequest
+
+        seen = []
+        with mock.patch.object(HttpRequest, 'execute',
+                               lambda self, http=None, num_retries=0: seen.append(num_retries)):
+            request.execute(**kwargs)
+        return seen[0]
+
+    def test_reads_retry(self):
+        self.assertEqual(self.num_retries(self.service.groups().get(groupKey=GROUP)), core.NUM_RETRIES)
+        self.assertEqual(self.num_retries(self.service.groups().list(domain='example.com')),
+                         core.NUM_RETRIES)
+
+    def test_writes_do_not_retry(self):
+        groups, members = self.service.groups(), self.service.members()
+        for request in (
+            groups.insert(body={'email': GROUP}),
+            groups.patch(groupKey=GROUP, body={'name': 'Class A'}),
+            groups.delete(groupKey=GROUP),
+            members.insert(groupKey=GROUP, body={'email': 'a@x.com'}),
+            members.delete(groupKey=GROUP, memberKey='a@x.com'),
+        ):
+            with self.subTest(method=request.method, uri=request.uri):
+                self.assertEqual(self.num_retries(request), 0)
+
+    def test_explicit_retries_are_kept(self):
+        request = self.service.groups().delete(groupKey=GROUP)
+        self.assertEqual(self.num_retries(request, num_retries=2), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
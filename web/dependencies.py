@@ -4,6 +4,7 @@ Shared dependencies for FastAPI routes.
 
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -20,7 +21,7 @@ templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
 
 # Configuration
 ALLOWED_DOMAIN = os.environ.get("ALLOWED_DOMAIN", "")
-DEFAULT_DOMAIN = os.environ.get("GOOGLE_GROUP_DOMAIN", "tinkertanker.com")
+DEFAULT_DOMAIN = core.DEFAULT_DOMAIN
 AVAILABLE_DOMAINS = ["tinkertanker.com", "swiftinsg.org"]
 
 
@@ -42,11 +43,18 @@ def require_auth(request: Request) -> dict:
     return user
 
 
+# Directory API service, reused for as long as the loaded credentials are unchanged
+_service_cache: dict = {"credentials": None, "service": None}
+
+
 def get_google_service(request: Request):
     """
     Get an authenticated Google Directory API service.
     Uses credentials from environment/file.
 
+    The service is built once and shared across requests; it is rebuilt
+    only when load_credentials returns different credentials.
+
     Note: API calls are delegated to ADMIN_EMAIL/DEFAULT_EMAIL, not the
     logged-in user. The logged-in user is for web app auth only; the service
     account delegation requires a Google Workspace admin.
@@ -58,6 +66,9 @@ def get_google_service(request: Request):
             detail=f"Service account credentials not configured: {creds_result.error}",
         )
 
+    if _service_cache["credentials"] is creds_result.credentials:
+        return _service_cache["service"]
+
     # Use configured admin email for delegation (not logged-in user)
     service = core.create_service(creds_result.credentials)
     if not service:
@@ -65,9 +76,41 @@ def get_google_service(request: Request):
             status_code=500, detail="Failed to create Google Directory API service"
         )
 
+    _service_cache["credentials"] = creds_result.credentials
+    _service_cache["service"] = service
     return service
 
 
+# Short-lived cache of Directory API reads, cleared whenever the app changes data
+CACHE_TTL = 30
+CACHE_MAX_ENTRIES = 64
+_read_cache: dict = {}
+
+
+def get_cached(key: tuple):
+    """Return a cached value, or None if missing or older than CACHE_TTL seconds."""
+    entry = _read_cache.get(key)
+    if entry and time.monotonic() - entry[0] < CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def set_cached(key: tuple, value) -> None:
+    """Store a value in the read cache, evicting the oldest entries when full."""
+    now = time.monotonic()
+    if key not in _read_cache and len(_read_cache) >= CACHE_MAX_ENTRIES:
+        for stale in [k for k, (stored, _) in _read_cache.items() if now - stored >= CACHE_TTL]:
+            del _read_cache[stale]
+        while len(_read_cache) >= CACHE_MAX_ENTRIES:
+            del _read_cache[next(iter(_read_cache))]
+    _read_cache[key] = (now, value)
+
+
+def clear_cache() -> None:
+    """Drop all cached reads, e.g. after changing a group or its members."""
+    _read_cache.clear()
+
+
 def flash(request: Request, message: str, category: str = "info"):
     """
     Add a flash message to the session.
@@ -82,10 +125,3 @@ def get_flash_messages(request: Request) -> list:
     """Get and clear flash messages from session."""
     messages = request.session.pop("flash_messages", [])
     return messages
-
-
-def build_group_email(group_name: str, domain: Optional[str] = None) -> str:
-    """Build full group email from name and optional domain."""
-    if "@" in group_name:
-        return group_name
-    return f"{group_name}@{domain or DEFAULT_DOMAIN}"
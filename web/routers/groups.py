@@ -18,6 +18,9 @@ from web.dependencies import (
     get_google_service,
     flash,
     get_flash_messages,
+    get_cached,
+    set_cached,
+    clear_cache,
     DEFAULT_DOMAIN,
     AVAILABLE_DOMAINS,
 )
@@ -32,21 +35,31 @@ async def list_groups(
     user: dict = Depends(require_auth),
 ):
     """List all groups from all domains with optional search filter."""
-    service = get_google_service(request)
-
-    # Fetch groups from all domains
-    all_groups = []
+    cache_key = ("groups", query or "")
+    all_groups = get_cached(cache_key)
     errors = []
 
-    for domain in AVAILABLE_DOMAINS:
-        result = core.list_groups(service, domain=domain, query=query)
-        if result.success:
-            all_groups.extend(result.data.get("groups", []))
-        else:
-            errors.append(f"{domain}: {result.error}")
+    if all_groups is None:
+        service = get_google_service(request)
+
+        # Fetch groups from all domains
+        all_groups = []
+        # The search box matches anywhere in email, name or description
+        results = core.list_groups_in_domains(
+            service, AVAILABLE_DOMAINS, query=query, local_filter=True
+        )
+        for domain, result in results.items():
+            if result.success:
+                all_groups.extend(result.data.get("groups", []))
+            else:
+                errors.append(f"{domain}: {result.error}")
+
+        # Sort by email address alphabetically
+        all_groups.sort(key=lambda g: g.get("email", "").lower())
 
-    # Sort by email address alphabetically
-    all_groups.sort(key=lambda g: g.get("email", "").lower())
+        # Only cache complete listings
+        if not errors:
+            set_cached(cache_key, all_groups)
 
     return templates.TemplateResponse(
         "groups/list.html",
@@ -115,35 +128,30 @@ async def create_group(
         flash(request, f"Failed to create group: {result.error}", "error")
         return RedirectResponse(url="/groups/new", status_code=303)
 
-    group_email = f"{validation.group_name}@{domain}"
+    clear_cache()
+    group_email = core.build_group_email(validation.group_name, domain)
     flash(request, f"Group {group_email} created successfully", "success")
 
-    # Wait for group to propagate
-    import time
-
-    time.sleep(2)
-
-    # Add trainer emails if provided
+    # Add trainer emails and, if requested, yourself in one batch request
     errors = []
-    if trainer_emails.strip():
-        emails = [
-            e.strip()
-            for e in trainer_emails.replace(",", "\n").split("\n")
-            if e.strip()
-        ]
-        for email in emails:
-            if core.validate_email(email):
-                add_result = core.add_member(service, group_email, email)
-                if not add_result.success:
-                    errors.append(f"Failed to add {email}: {add_result.error}")
+    emails, invalid = core.parse_email_list(trainer_emails)
+    errors.extend(f"Invalid email: {email}" for email in invalid)
+    new_members = [(email, "MEMBER") for email in emails]
+    if add_self and user["email"].lower() not in {email.lower() for email in emails}:
+        new_members.append((user["email"], "MEMBER"))
+
+    if new_members:
+        # Poll until the new group is visible rather than sleeping a fixed time
+        core.ensure_group_exists(service, group_email)
+        results = core.add_members(service, group_email, new_members)
+        for (email, _), add_result in zip(new_members, results):
+            if add_result.success:
+                continue
+            if add_self and email == user["email"]:
+                if "already exists" not in str(add_result.error):
+                    errors.append(f"Failed to add yourself: {add_result.error}")
             else:
-                errors.append(f"Invalid email: {email}")
-
-    # Add self if requested
-    if add_self:
-        add_result = core.add_member(service, group_email, user["email"])
-        if not add_result.success and "already exists" not in str(add_result.error):
-            errors.append(f"Failed to add yourself: {add_result.error}")
+                errors.append(f"Failed to add {email}: {add_result.error}")
 
     if errors:
         for err in errors:
@@ -161,30 +169,41 @@ async def group_members(
     user: dict = Depends(require_auth),
 ):
     """Show group members."""
-    service = get_google_service(request)
-
-    # Get group info
-    group_result = core.get_group(service, group_email)
-    if not group_result.success:
-        flash(request, f"Group not found: {group_result.error}", "error")
-        return RedirectResponse(url="/groups", status_code=303)
-
-    # Get members
-    members_result = core.list_members(service, group_email)
+    cache_key = ("members", group_email)
+    cached = get_cached(cache_key)
+
+    if cached is None:
+        service = get_google_service(request)
+
+        # Get group info
+        group_result = core.get_group(service, group_email, fields="email,name,description")
+        if not group_result.success:
+            flash(request, f"Group not found: {group_result.error}", "error")
+            return RedirectResponse(url="/groups", status_code=303)
+
+        # Get members
+        members_result = core.list_members(service, group_email)
+        group = group_result.data
+        members = members_result.data.get("members", []) if members_result.success else []
+        summary = members_result.data.get("summary", {}) if members_result.success else {}
+        error = members_result.error if not members_result.success else None
+
+        # Only cache complete listings
+        if members_result.success:
+            set_cached(cache_key, (group, members, summary))
+    else:
+        group, members, summary = cached
+        error = None
 
     return templates.TemplateResponse(
         "groups/members.html",
         {
             "request": request,
             "user": user,
-            "group": group_result.data,
-            "members": members_result.data.get("members", [])
-            if members_result.success
-            else [],
-            "summary": members_result.data.get("summary", {})
-            if members_result.success
-            else {},
-            "error": members_result.error if not members_result.success else None,
+            "group": group,
+            "members": members,
+            "summary": summary,
+            "error": error,
             "edit_mode": edit or rename,
             "flash_messages": get_flash_messages(request),
         },
@@ -237,7 +256,7 @@ async def edit_group(
     service = get_google_service(request)
 
     _, old_domain = group_email.split("@")
-    new_email = f"{validation.group_name}@{old_domain}"
+    new_email = core.build_group_email(validation.group_name, old_domain)
 
     result = core.update_group(
         service,
@@ -248,6 +267,7 @@ async def edit_group(
     )
 
     if result.success:
+        clear_cache()
         if new_email != group_email:
             flash(request, f"Group updated to {new_email}", "success")
         else:
@@ -271,6 +291,7 @@ async def delete_group(
     result = core.delete_group(service, group_email)
 
     if result.success:
+        clear_cache()
         flash(request, f"Group {group_email} deleted", "success")
         # Return htmx response to redirect
         response = HTMLResponse(content="", status_code=200)
@@ -294,6 +315,7 @@ async def delete_group_form(
     result = core.delete_group(service, group_email)
 
     if result.success:
+        clear_cache()
         flash(request, f"Group {group_email} deleted", "success")
     else:
         flash(request, f"Failed to delete: {result.error}", "error")
@@ -17,6 +17,7 @@ from web.dependencies import (
     get_google_service,
     flash,
     get_flash_messages,
+    clear_cache,
 )
 
 router = APIRouter()
@@ -30,21 +31,35 @@ async def add_member(
     role: str = Form("MEMBER"),
     user: dict = Depends(require_auth),
 ):
-    """Add a member to a group."""
-    if not core.validate_email(member_email):
-        flash(request, f"Invalid email address: {member_email}", "error")
+    """Add one or more members to a group.
+
+    The field accepts several addresses separated by commas, spaces or
+    newlines; they are added in a single batch request.
+    """
+    emails, invalid = core.parse_email_list(member_email)
+    for entry in invalid:
+        flash(request, f"Invalid email address: {entry}", "error")
+    if not emails:
+        if not invalid:
+            flash(request, "Please enter an email address", "error")
         return RedirectResponse(url=f"/groups/{group_email}/members", status_code=303)
 
-    if role not in ("OWNER", "MANAGER", "MEMBER"):
+    if role not in core.VALID_ROLES:
         role = "MEMBER"
 
     service = get_google_service(request)
-    result = core.add_member(service, group_email, member_email, role=role)
-
-    if result.success:
-        flash(request, f"Added {member_email} as {role}", "success")
-    else:
-        flash(request, f"Failed to add member: {result.error}", "error")
+    results = core.add_members(service, group_email, [(email, role) for email in emails])
+
+    added = [email for email, result in zip(emails, results) if result.success]
+    if added:
+        clear_cache()
+    if len(added) == 1:
+        flash(request, f"Added {added[0]} as {role}", "success")
+    elif added:
+        flash(request, f"Added {len(added)} members as {role}", "success")
+    for email, result in zip(emails, results):
+        if not result.success:
+            flash(request, f"Failed to add {email}: {result.error}", "error")
 
     return RedirectResponse(url=f"/groups/{group_email}/members", status_code=303)
 
@@ -61,6 +76,7 @@ async def remove_member(
     result = core.remove_member(service, group_email, member_email)
 
     if result.success:
+        clear_cache()
         # Return empty response for htmx to remove the row
         return HTMLResponse(content="", status_code=200)
     else:
@@ -82,6 +98,7 @@ async def remove_member_form(
     result = core.remove_member(service, group_email, member_email)
 
     if result.success:
+        clear_cache()
         flash(request, f"Removed {member_email}", "success")
     else:
         flash(request, f"Failed to remove: {result.error}", "error")
@@ -98,7 +115,7 @@ async def update_member_role(
     user: dict = Depends(require_auth),
 ):
     """Update a member's role."""
-    if role not in ("OWNER", "MANAGER", "MEMBER"):
+    if role not in core.VALID_ROLES:
         flash(request, "Invalid role", "error")
         return RedirectResponse(url=f"/groups/{group_email}/members", status_code=303)
 
@@ -106,6 +123,7 @@ async def update_member_role(
     result = core.update_member_role(service, group_email, member_email, role)
 
     if result.success:
+        clear_cache()
         flash(request, f"Updated {member_email} to {role}", "success")
     else:
         flash(request, f"Failed to update role: {result.error}", "error")
@@ -124,7 +142,7 @@ async def update_member_role_htmx(
     form = await request.form()
     role = form.get("role", "MEMBER")
 
-    if role not in ("OWNER", "MANAGER", "MEMBER"):
+    if role not in core.VALID_ROLES:
         return HTMLResponse(
             content='<div class="text-red-600 text-sm">Invalid role</div>',
             status_code=400,
@@ -134,6 +152,7 @@ async def update_member_role_htmx(
     result = core.update_member_role(service, group_email, member_email, role)
 
     if result.success:
+        clear_cache()
         return HTMLResponse(
             content=f'<span class="text-green-600">{role}</span>',
             status_code=200,